@@ -0,0 +1,90 @@
+"""Compare the dict-keyed graph search with the array-backed ``IndexedGraph``.
+
+Runs A* corner to corner and a full Dijkstra on random grids of increasing
+size, the shape of 2022 day 12 and 2024 day 18::
+
+    python -m aoc.benchmarks.graph_engines
+"""
+
+import random
+import statistics
+import time
+from typing import Callable, Iterable, List, Tuple
+
+from aoc.common.graph import IndexedGraph, astar_with_cost, djikstra
+from aoc.common.point import Point
+from aoc.utils.table import format_table
+
+SIZES = [50, 100, 200]
+WALL_DENSITY = 0.2
+RUNS = 3
+
+
+def random_grid(
+    size: int, seed: int = 0
+) -> Callable[[Point], Iterable[Tuple[Point, int]]]:
+    rng = random.Random(seed)
+    bound = Point(size, size)
+    walls = {
+        Point(x, y)
+        for x in range(size)
+        for y in range(size)
+        if rng.random() < WALL_DENSITY
+    }
+    walls -= {Point(0, 0), Point(size - 1, size - 1)}
+
+    def neighbors(p: Point) -> Iterable[Tuple[Point, int]]:
+        for point in p.adjacent_points(diagonal=False, upper_bound=bound):
+            if point not in walls:
+                yield point, 1
+
+    return neighbors
+
+
+def manhattan(p1: Point, p2: Point) -> int:
+    return p1.manhattan_distance(p2)
+
+
+def timed(func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    rows: List[List[str]] = []
+    for size in SIZES:
+        neighbors = random_grid(size)
+        graph = IndexedGraph.grid(Point(size, size))
+        start, end = Point(0, 0), Point(size - 1, size - 1)
+        cases = [
+            (
+                "astar",
+                lambda: astar_with_cost(start, end, manhattan, neighbors),
+                lambda: graph.astar_with_cost(start, end, manhattan, neighbors),
+            ),
+            (
+                "djikstra",
+                lambda: djikstra(start, neighbors),
+                lambda: graph.djikstra(start, neighbors),
+            ),
+        ]
+        for name, generic, indexed in cases:
+            generic_time, indexed_time = timed(generic), timed(indexed)
+            rows.append(
+                [
+                    name,
+                    f"{size}x{size}",
+                    f"{generic_time:.4f}s",
+                    f"{indexed_time:.4f}s",
+                    f"{generic_time / indexed_time:.2f}x",
+                ]
+            )
+    print(format_table(["Search", "Grid", "Generic", "Indexed", "Speedup"], rows))
+
+
+if __name__ == "__main__":
+    main()
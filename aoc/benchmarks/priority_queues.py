@@ -0,0 +1,105 @@
+"""Compare the lazy-deletion ``PriorityQueue`` with ``IndexedPriorityQueue``
+and the monotone ``BucketQueue`` and ``RadixHeap``.
+
+Runs Dijkstra over random weighted grids, where priorities rarely change,
+and over a dense random graph, where queued nodes are improved again and
+again, and reports the time taken and the largest heap each queue built::
+
+    python -m aoc.benchmarks.priority_queues
+"""
+
+import random
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+from aoc.common.priority_queue import (
+    BucketQueue,
+    IndexedPriorityQueue,
+    PriorityQueue,
+    RadixHeap,
+)
+from aoc.utils.table import format_table
+
+GRID_SIZES = [100, 300]
+DENSE_NODES = 5000
+DENSE_DEGREE = 40
+RUNS = 3
+
+Graph = List[List[Tuple[int, int]]]
+BenchQueue = (
+    PriorityQueue[int] | IndexedPriorityQueue[int] | BucketQueue[int] | RadixHeap[int]
+)
+
+
+def random_grid(size: int, seed: int = 0) -> Graph:
+    """A grid with weights from 1 to 9: few priorities ever change."""
+    rng = random.Random(seed)
+    weights = [rng.randint(1, 9) for _ in range(size * size)]
+    graph: Graph = [[] for _ in range(size * size)]
+    for x in range(size):
+        for y in range(size):
+            for nx, ny in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+                if 0 <= nx < size and 0 <= ny < size:
+                    neighbor = nx * size + ny
+                    graph[x * size + y].append((neighbor, weights[neighbor]))
+    return graph
+
+
+def random_dense(nodes: int, degree: int, seed: int = 0) -> Graph:
+    """Many edges with widely spread weights: most nodes are improved
+    several times while queued.
+    """
+    rng = random.Random(seed)
+    return [
+        [(rng.randrange(nodes), rng.randint(1, 1000)) for _ in range(degree)]
+        for _ in range(nodes)
+    ]
+
+
+def djikstra(graph: Graph, queue: BenchQueue) -> int:
+    """Run Dijkstra from node 0, returning the largest the heap grew."""
+    costs: Dict[int, int] = {0: 0}
+    queue.push(0, 0)
+    peak = 1
+    while queue:
+        node, cost = queue.pop_with_priorty()
+        for neighbor, weight in graph[node]:
+            new_cost = cost + weight
+            if new_cost < costs.get(neighbor, new_cost + 1):
+                costs[neighbor] = new_cost
+                queue.push(neighbor, new_cost)
+        peak = max(peak, queue.heap_size)
+    return peak
+
+
+def timed(func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    rows: List[List[str]] = []
+    graphs = [(f"grid {size}x{size}", random_grid(size)) for size in GRID_SIZES]
+    graphs.append(
+        (f"dense {DENSE_NODES}x{DENSE_DEGREE}", random_dense(DENSE_NODES, DENSE_DEGREE))
+    )
+    for graph_name, graph in graphs:
+        for name, queue_type in [
+            ("PriorityQueue", PriorityQueue),
+            ("IndexedPriorityQueue", IndexedPriorityQueue),
+            ("BucketQueue", BucketQueue),
+            ("RadixHeap", RadixHeap),
+        ]:
+            peak = djikstra(graph, queue_type())
+            elapsed = timed(lambda: djikstra(graph, queue_type()))
+            rows.append([name, graph_name, f"{elapsed:.4f}s", str(peak)])
+    print(format_table(["Queue", "Graph", "Time", "Peak heap"], rows))
+
+
+if __name__ == "__main__":
+    main()
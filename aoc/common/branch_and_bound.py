@@ -0,0 +1,112 @@
+"""Best-first branch and bound for maximisation puzzles.
+
+States are explored in order of an optimistic ``upper_bound`` and dropped as
+soon as that bound can't beat the best ``value`` seen so far. States are also
+dropped when they are dominated: two states with the same ``key`` are
+compared on their ``criteria`` vectors, and one that is no better in every
+coordinate than a state already seen can't lead anywhere new.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Tuple, TypeVar
+
+from aoc.common.priority_queue import PriorityQueue
+from aoc.common.search_stats import SearchStats, observe
+
+S = TypeVar("S")
+Vector = Tuple[int, ...]
+
+
+@dataclass
+class ParetoFront:
+    """Vectors none of which is dominated by another, where ``a`` dominates
+    ``b`` when ``a[i] >= b[i]`` for every ``i``.
+
+    The vectors are kept in lexicographic order. A vector can only be
+    dominated by ones that sort after it and only dominate ones that sort
+    before it, so each check scans one side of a bisection.
+    """
+
+    vectors: List[Vector] = field(default_factory=list)
+
+    def dominated(self, vector: Vector) -> bool:
+        for other in self.vectors[bisect_left(self.vectors, vector) :]:
+            if all(a >= b for a, b in zip(other, vector)):
+                return True
+        return False
+
+    def add(self, vector: Vector) -> bool:
+        """Add ``vector`` unless it is dominated, dropping any vectors it
+        dominates. Returns whether it was added.
+        """
+        if self.dominated(vector):
+            return False
+        end = bisect_right(self.vectors, vector)
+        kept = [
+            other
+            for other in self.vectors[:end]
+            if not all(a <= b for a, b in zip(other, vector))
+        ]
+        self.vectors[:end] = kept
+        self.vectors.insert(len(kept), vector)
+        return True
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+
+@dataclass
+class BranchAndBoundResult(Generic[S]):
+    state: S
+    value: int
+    stats: SearchStats
+
+
+def branch_and_bound(
+    start: S,
+    successors: Callable[[S], Iterable[S]],
+    value: Callable[[S], int],
+    upper_bound: Callable[[S], int],
+    key: Callable[[S], Hashable],
+    criteria: Callable[[S], Vector],
+    stats: SearchStats | None = None,
+) -> BranchAndBoundResult[S]:
+    """The state with the highest ``value`` reachable from ``start``.
+
+    ``value`` must be achievable from the state it's given, and
+    ``upper_bound`` must never be lower than the value of any state reachable
+    from it. Larger ``criteria`` must never be worse: a state whose criteria
+    are all at least those of another with the same key has to reach
+    everything the other one can. Dominated states and states whose bound
+    can't beat the best value are counted as ``pruned``.
+    """
+    stats = observe(stats, "branch_and_bound") or SearchStats("branch_and_bound")
+    fronts: Dict[Hashable, ParetoFront] = {}
+    open_list: PriorityQueue[S] = PriorityQueue()
+    best, best_value = start, value(start)
+    open_list.push(start, -upper_bound(start))
+    fronts[key(start)] = ParetoFront([criteria(start)])
+    while open_list:
+        state, priority = open_list.pop_with_priorty()
+        if -priority <= best_value:
+            # Everything left is bounded by this state's bound
+            stats.pruned += len(open_list) + 1
+            break
+        stats.expand(state, len(open_list))
+        for child in successors(state):
+            stats.generated += 1
+            child_value = value(child)
+            if child_value > best_value:
+                best, best_value = child, child_value
+            bound = upper_bound(child)
+            if bound <= best_value:
+                stats.pruned += 1
+                continue
+            front = fronts.setdefault(key(child), ParetoFront())
+            if not front.add(criteria(child)):
+                stats.pruned += 1
+                continue
+            open_list.push(child, -bound)
+            stats.push(len(open_list))
+    return BranchAndBoundResult(best, best_value, stats)
@@ -1,10 +1,27 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Callable, Dict, Generic, Iterable, List, Protocol, Tuple, TypeVar
+from heapq import heappop, heappush
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Protocol,
+    Self,
+    Tuple,
+    TypeVar,
+)
 
 from immutables import Map
 
-from aoc.common.priority_queue import PriorityQueue
+from aoc.common.point import Point
+from aoc.common.priority_queue import PriorityQueue, Queue
+from aoc.common.search_stats import SearchStats, observe
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -17,7 +34,11 @@ class Optimizable(Protocol[T_co]):
     @cached_property
     def heuristic(self) -> int: ...
 
-    def egress(self) -> Iterable[Tuple["Optimizable[T_co]", int]]: ...
+    def egress(self) -> Iterable[Tuple[Self, int]]: ...
+
+
+# The state type a search is run over, so its results keep that type
+S = TypeVar("S", bound=Optimizable[Any])
 
 
 @dataclass(frozen=True)
@@ -27,11 +48,11 @@ class OptimizeWrapper(Generic[T]):
     _heuristic: Callable[[T, T], int]
     _egress: Callable[[T], Iterable[Tuple[T, int]]]
 
-    @property
+    @cached_property
     def is_finished(self) -> bool:
         return self.current == self.end
 
-    @property
+    @cached_property
     def heuristic(self) -> int:
         return self._heuristic(self.current, self.end)
 
@@ -48,9 +69,11 @@ def astar_with_cost(
     end: T,
     heuristic: Callable[[T, T], int],
     neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
 ) -> tuple[List[T], int]:
     wrapped: OptimizeWrapper[T] = OptimizeWrapper(start, end, heuristic, neighbors)
-    result, cost = astar_optimizable(wrapped)  # type: ignore
+    result, cost = astar_optimizable(wrapped, stats=stats, queue=queue)  # type: ignore
     return [x.current for x in result], cost
 
 
@@ -59,45 +82,784 @@ def astar(
     end: T,
     heuristic: Callable[[T, T], int],
     neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
 ) -> List[T]:
-    return astar_with_cost(start, end, heuristic, neighbors)[0]
+    return astar_with_cost(start, end, heuristic, neighbors, stats, queue)[0]
 
 
-def astar_optimizable(start: Optimizable[T]) -> tuple[List[T], int]:
-    open_list: PriorityQueue[Optimizable[T]] = PriorityQueue()
-    path: Dict[Optimizable[T], Tuple[Optimizable[T], int]] = {}
-    open_list.push(start, 0)
+def astar_optimizable(
+    start: Optimizable[T],
+    consistent: bool = False,
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
+) -> tuple[List[T], int]:
+    result = astar_search(start, consistent, stats, queue)
+    return result.path, result.cost  # type: ignore
+
+
+@dataclass(frozen=True)
+class SearchResult(Generic[T]):
+    path: List[T]
+    cost: int
+    stats: SearchStats
+
+
+def astar_search(
+    start: S,
+    consistent: bool = False,
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
+) -> SearchResult[S]:
+    """A* over ``start.egress()``, counting the work it does.
+
+    Each state's ``heuristic`` is read once and cached. A closed node found
+    again at a lower cost is reopened, unless ``consistent`` promises the
+    heuristic never needs that, in which case closed nodes are skipped
+    outright.
+
+    ``queue`` makes the open list; the monotone ``BucketQueue`` and
+    ``RadixHeap`` need a consistent heuristic.
+    """
+    stats = observe(stats, "astar") or SearchStats("astar")
+    open_list: Queue[S] = queue()
+    g_costs: Dict[S, int] = {start: 0}
+    parents: Dict[S, S] = {}
+    estimates: Dict[S, int] = {start: start.heuristic}
+    closed: set[S] = set()
+    open_list.push(start, estimates[start])
+    stats.push(1)
     while open_list:
         node = open_list.pop()
-        node_cost = 0
-        if node in path:
-            node_cost = path[node][1]
+        stats.stale_pops = open_list.stale_pops
+        node_cost = g_costs[node]
         if node.is_finished:
-            result: List[Optimizable[T]] = [node]
+            result: List[S] = [node]
             while node != start:
-                node = path[node][0]
+                node = parents[node]
                 result.append(node)
-            return list(reversed(result)), node_cost  # type: ignore
+            return SearchResult(list(reversed(result)), node_cost, stats)
+        closed.add(node)
+        stats.expand(node, len(open_list))
+        batch = []
+        decrease_keys = 0
         for neighbor, weight in node.egress():
+            stats.generated += 1
             g_cost = node_cost + weight
-            existing_neighbor = path.get(neighbor, None)
-            if existing_neighbor is None or (g_cost < existing_neighbor[1]):
-                path[neighbor] = (node, g_cost)
-                open_list.push(neighbor, g_cost + node.heuristic)
+            if consistent and neighbor in closed:
+                continue
+            existing = g_costs.get(neighbor)
+            if existing is not None and g_cost >= existing:
+                continue
+            if neighbor in closed:
+                closed.remove(neighbor)
+                stats.reopened += 1
+            g_costs[neighbor] = g_cost
+            parents[neighbor] = node
+            estimate = estimates.get(neighbor)
+            if estimate is None:
+                estimate = estimates[neighbor] = neighbor.heuristic
+            decrease_keys += neighbor in open_list
+            batch.append((neighbor, g_cost + estimate))
+        open_list.push_many(batch)
+        stats.push_many(len(open_list), len(batch), decrease_keys)
+    raise Exception("No path found")
+
+
+def beam_search(
+    start: S, width: int, stats: SearchStats | None = None
+) -> SearchResult[S]:
+    """Best-first search that only keeps the ``width`` most promising nodes
+    of each layer.
+
+    Memory is bounded by ``width`` times the search depth, but the result is
+    only as good as the nodes the beam kept: it may be suboptimal, or miss a
+    path that exists.
+    """
+    stats = observe(stats, "beam") or SearchStats("beam")
+    g_costs: Dict[S, int] = {start: 0}
+    parents: Dict[S, S | None] = {start: None}
+    beam: List[S] = [start]
+    best: S | None = start if start.is_finished else None
+    while beam:
+        layer: Dict[S, Tuple[int, int, S]] = {}
+        for node in beam:
+            stats.expand(node, len(beam))
+            for neighbor, weight in node.egress():
+                stats.generated += 1
+                g_cost = g_costs[node] + weight
+                if g_cost >= g_costs.get(neighbor, g_cost + 1):
+                    continue
+                if neighbor in layer and g_cost >= layer[neighbor][0]:
+                    continue
+                layer[neighbor] = (g_cost, g_cost + neighbor.heuristic, node)
+        if best is not None:
+            # Only nodes that could still beat the best finish are worth keeping
+            layer = {n: v for n, v in layer.items() if v[1] < g_costs[best]}
+        ranked = sorted(layer, key=lambda n: layer[n][1])
+        stats.pruned += max(0, len(ranked) - width)
+        beam = ranked[:width]
+        for node in beam:
+            g_costs[node], _, parents[node] = layer[node]
+            stats.push(len(beam))
+            if node.is_finished and (best is None or g_costs[node] < g_costs[best]):
+                best = node
+        beam = [node for node in beam if not node.is_finished]
+    if best is None:
+        raise Exception("No path found")
+    return SearchResult(_walk_back(best, parents), g_costs[best], stats)
+
+
+def ida_star(start: S, stats: SearchStats | None = None) -> SearchResult[S]:
+    """Iterative-deepening A*: depth-first passes under a growing f-cost bound.
+
+    Only the current path is held in memory. Each pass re-explores the
+    previous ones, so it suits searches with few distinct f-costs. Optimal
+    when ``heuristic`` is admissible.
+    """
+    stats = observe(stats, "ida_star") or SearchStats("ida_star")
+    if start.is_finished:
+        return SearchResult([start], 0, stats)
+    bound = start.heuristic
+    while True:
+        next_bound: int | None = None
+        path: List[S] = [start]
+        on_path = {start}
+        costs = [0]
+        stack = [iter(start.egress())]
+        stats.expand(start, 1)
+        while stack:
+            for neighbor, weight in stack[-1]:
+                stats.generated += 1
+                if neighbor in on_path:
+                    continue
+                g_cost = costs[-1] + weight
+                f_cost = g_cost + neighbor.heuristic
+                if f_cost > bound:
+                    if next_bound is None or f_cost < next_bound:
+                        next_bound = f_cost
+                    continue
+                if neighbor.is_finished:
+                    return SearchResult(path + [neighbor], g_cost, stats)
+                path.append(neighbor)
+                on_path.add(neighbor)
+                costs.append(g_cost)
+                stack.append(iter(neighbor.egress()))
+                stats.expand(neighbor, len(stack))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+                costs.pop()
+        if next_bound is None:
+            raise Exception("No path found")
+        bound = next_bound
+
+
+@dataclass(eq=False)
+class _TreeNode(Generic[T]):
+    state: T
+    g_cost: int
+    f_cost: float
+    parent: "_TreeNode[T] | None"
+    depth: int
+    children: Dict[T, "_TreeNode[T]"] = field(default_factory=dict)
+    forgotten: float = float("inf")
+    queued: bool = False
+    stored: bool = True
+
+    def path(self) -> List[T]:
+        result = []
+        node: _TreeNode[T] | None = self
+        while node is not None:
+            result.append(node.state)
+            node = node.parent
+        return list(reversed(result))
+
+
+def memory_bounded_astar(
+    start: S, max_nodes: int, stats: SearchStats | None = None
+) -> SearchResult[S]:
+    """Tree-search A* that never stores more than ``max_nodes`` nodes, after
+    SMA*.
+
+    When memory is full the stored leaf with the highest f-cost is forgotten.
+    Its f-cost is backed up into its parent, which goes back on the open list
+    so the leaf can be regenerated if it ever looks promising again. Like
+    SMA*, it's optimal when the optimal path fits in ``max_nodes``. States
+    are not deduplicated across branches, so it suits tree-like spaces.
+    Forgotten nodes are counted as ``pruned``.
+    """
+    stats = observe(stats, "memory_bounded_astar") or SearchStats(
+        "memory_bounded_astar"
+    )
+    counter = 0
+    stored = 1
+    truncated = False
+    open_heap: List[Tuple[float, int, int, _TreeNode[S]]] = []
+    leaf_heap: List[Tuple[float, int, int, _TreeNode[S]]] = []
+
+    def enqueue(node: _TreeNode[S]) -> None:
+        nonlocal counter
+        counter += 1
+        node.queued = True
+        # Prefer deep nodes to expand and shallow ones to forget
+        heappush(open_heap, (node.f_cost, -node.depth, counter, node))
+        stats.push(len(open_heap))
+
+    def mark_leaf(node: _TreeNode[S]) -> None:
+        nonlocal counter
+        counter += 1
+        heappush(leaf_heap, (-node.f_cost, node.depth, counter, node))
+
+    def forget(protected: _TreeNode[S]) -> None:
+        nonlocal stored
+        skipped = []
+        while leaf_heap:
+            entry = heappop(leaf_heap)
+            _, _, _, node = entry
+            if not node.stored or node.children or node.parent is None:
+                continue
+            if node is protected or node.parent is protected:
+                skipped.append(entry)
+                continue
+            parent = node.parent
+            del parent.children[node.state]
+            node.stored = node.queued = False
+            stored -= 1
+            stats.pruned += 1
+            parent.forgotten = min(parent.forgotten, node.f_cost)
+            if parent.forgotten != float("inf") and (
+                not parent.queued or parent.forgotten < parent.f_cost
+            ):
+                parent.f_cost = parent.forgotten
+                enqueue(parent)
+            if not parent.children:
+                if not parent.queued:
+                    # Every child was a dead end, so the parent is one too
+                    parent.f_cost = parent.forgotten
+                mark_leaf(parent)
+            break
+        else:
+            raise MemoryError(f"A path needs more than {max_nodes} nodes")
+        for entry in skipped:
+            heappush(leaf_heap, entry)
+
+    root: _TreeNode[S] = _TreeNode(start, 0, start.heuristic, None, 0)
+    enqueue(root)
+    while open_heap:
+        f_cost, _, _, node = heappop(open_heap)
+        if not node.queued or node.f_cost != f_cost:
+            stats.stale_pops += 1
+            continue
+        node.queued = False
+        if node.state.is_finished:
+            return SearchResult(node.path(), node.g_cost, stats)
+        stats.expand(node.state, len(open_heap))
+        node.forgotten = float("inf")
+        if node.depth + 1 < max_nodes:
+            on_path = set(node.path())
+            for neighbor, weight in node.state.egress():
+                stats.generated += 1
+                if neighbor in node.children or neighbor in on_path:
+                    continue
+                while stored >= max_nodes:
+                    forget(node)
+                g_cost = node.g_cost + weight
+                # Pathmax keeps f-costs from shrinking along a path
+                f_cost = max(node.f_cost, g_cost + neighbor.heuristic)
+                child = _TreeNode(neighbor, g_cost, f_cost, node, node.depth + 1)
+                node.children[neighbor] = child
+                stored += 1
+                enqueue(child)
+                mark_leaf(child)
+        else:
+            truncated = True
+        if not node.children:
+            # A dead end, or too deep to fit: never worth regenerating
+            node.f_cost = float("inf")
+            mark_leaf(node)
+    if truncated:
+        raise MemoryError(f"No path found within {max_nodes} nodes")
     raise Exception("No path found")
 
 
+def _record_push(stats: SearchStats, open_list: Queue[T], item: T) -> None:
+    """Count a push of ``item`` that's about to happen."""
+    queued = item in open_list
+    stats.push(len(open_list) + (not queued), queued)
+
+
 def djikstra(
     start: T,
     neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
 ) -> Map[T, int]:
-    open_list: PriorityQueue[T] = PriorityQueue()
+    return multi_source_djikstra([start], neighbors, stats=stats, queue=queue)
+
+
+def multi_source_djikstra(
+    starts: Iterable[T],
+    neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+    targets: Collection[T] | None = None,
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
+) -> Map[T, int]:
+    """Cost of reaching each node from whichever of ``starts`` is closest.
+
+    With ``targets`` the search stops once every target has been settled.
+    Running it over ``reverse_graph`` (or a hand-written predecessor function)
+    gives each node's cost *to* the nearest of ``starts`` instead. Small
+    integer weights are cheaper to queue in a ``BucketQueue`` or
+    ``RadixHeap``, passed as ``queue``.
+    """
+    stats = observe(stats, "djikstra")
+    open_list: Queue[T] = queue()
+    best: Dict[T, int] = {}
     result: dict[T, int] = {}
-    open_list.push(start, 0)
+    for start in starts:
+        best[start] = 0
+    open_list.push_many((start, 0) for start in best)
+    if stats is not None:
+        stats.push_many(len(open_list), len(best))
+    remaining = set(targets) if targets is not None else None
     while open_list:
         node, cost = open_list.pop_with_priorty()
         result[node] = cost
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+        if stats is not None:
+            stats.stale_pops = open_list.stale_pops
+            stats.expand(node, len(open_list))
+        batch = []
+        decrease_keys = 0
         for neighbor, neighbor_cost in neighbors(node):
-            if neighbor not in result:
-                open_list.push(neighbor, cost + neighbor_cost)
+            if stats is not None:
+                stats.generated += 1
+            g_cost = cost + neighbor_cost
+            if neighbor not in result and g_cost < best.get(neighbor, g_cost + 1):
+                best[neighbor] = g_cost
+                if stats is not None:
+                    decrease_keys += neighbor in open_list
+                batch.append((neighbor, g_cost))
+        open_list.push_many(batch)
+        if stats is not None:
+            stats.push_many(len(open_list), len(batch), decrease_keys)
     return Map(result)
+
+
+@dataclass(frozen=True)
+class ShortestPathDag(Generic[T]):
+    """Every shortest path from ``start``, as recorded by ``djikstra_dag``.
+
+    ``predecessors`` maps each reached node to all the nodes it can be
+    reached from at its minimal cost. Edge weights must be positive so the
+    predecessors form a DAG; ``order`` lists the nodes in the order they were
+    settled, which is a topological order of that DAG.
+    """
+
+    start: T
+    costs: Map[T, int]
+    predecessors: Map[T, Tuple[T, ...]]
+    order: Tuple[T, ...]
+
+    def _best_targets(self, targets: Iterable[T]) -> List[T]:
+        reached = [target for target in targets if target in self.costs]
+        if not reached:
+            return []
+        best = min(self.costs[target] for target in reached)
+        return [target for target in reached if self.costs[target] == best]
+
+    def count_paths(self, targets: Iterable[T]) -> int:
+        """How many distinct shortest paths lead to the nearest of ``targets``."""
+        counts: Dict[T, int] = {self.start: 1}
+        for node in self.order[1:]:
+            counts[node] = sum(counts[p] for p in self.predecessors[node])
+        return sum(counts[target] for target in self._best_targets(targets))
+
+    def nodes_on_paths(self, targets: Iterable[T]) -> set[T]:
+        """Every node on at least one shortest path to the nearest of ``targets``."""
+        stack = self._best_targets(targets)
+        result = set(stack)
+        while stack:
+            for predecessor in self.predecessors[stack.pop()]:
+                if predecessor not in result:
+                    result.add(predecessor)
+                    stack.append(predecessor)
+        return result
+
+    def paths(self, targets: Iterable[T]) -> Iterator[List[T]]:
+        """Each shortest path to the nearest of ``targets``, start first."""
+        stack = [[target] for target in self._best_targets(targets)]
+        while stack:
+            reversed_path = stack.pop()
+            if reversed_path[-1] == self.start:
+                yield list(reversed(reversed_path))
+                continue
+            for predecessor in self.predecessors[reversed_path[-1]]:
+                stack.append(reversed_path + [predecessor])
+
+
+def djikstra_dag(
+    start: T,
+    neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+    targets: Collection[T] | None = None,
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
+) -> ShortestPathDag[T]:
+    """Like ``djikstra``, but remembers every equal-cost predecessor.
+
+    With ``targets`` the search stops once the nearest target, and any other
+    target at the same cost, has been settled.
+    """
+    stats = observe(stats, "djikstra_dag")
+    open_list: Queue[T] = queue()
+    best: Dict[T, int] = {start: 0}
+    predecessors: Dict[T, List[T]] = {start: []}
+    costs: Dict[T, int] = {}
+    if stats is not None:
+        _record_push(stats, open_list, start)
+    open_list.push(start, 0)
+    target_set = set(targets) if targets is not None else set()
+    limit: int | None = None
+    while open_list:
+        node, cost = open_list.pop_with_priorty()
+        if limit is not None and cost > limit:
+            break
+        costs[node] = cost
+        if node in target_set:
+            limit = cost
+        if stats is not None:
+            stats.stale_pops = open_list.stale_pops
+            stats.expand(node, len(open_list))
+        for neighbor, weight in neighbors(node):
+            if stats is not None:
+                stats.generated += 1
+            g_cost = cost + weight
+            if neighbor in costs:
+                continue
+            existing = best.get(neighbor)
+            if existing is None or g_cost < existing:
+                best[neighbor] = g_cost
+                predecessors[neighbor] = [node]
+                if stats is not None:
+                    _record_push(stats, open_list, neighbor)
+                open_list.push(neighbor, g_cost)
+            elif g_cost == existing:
+                predecessors[neighbor].append(node)
+    return ShortestPathDag(
+        start,
+        Map(costs),
+        Map({node: tuple(predecessors[node]) for node in costs}),
+        tuple(costs),
+    )
+
+
+def _walk_back(node: T, parents: Dict[T, T | None]) -> List[T]:
+    result = [node]
+    while (parent := parents[result[-1]]) is not None:
+        result.append(parent)
+    return list(reversed(result))
+
+
+def multi_astar_with_cost(
+    starts: Iterable[T],
+    ends: Collection[T],
+    heuristic: Callable[[T, T], int],
+    neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+    stats: SearchStats | None = None,
+    queue: Callable[[], Queue[Any]] = PriorityQueue,
+) -> tuple[List[T], int]:
+    """Cheapest path from any of ``starts`` to any of ``ends`` in one search.
+
+    A node is estimated against its nearest end. Expanded nodes are never
+    reopened, so ``heuristic`` must be consistent (never dropping by more
+    than an edge's weight across it); the minimum over the ends then is too.
+    """
+    end_set = set(ends)
+
+    def estimate(node: T) -> int:
+        return min(heuristic(node, end) for end in end_set)
+
+    stats = observe(stats, "multi_astar")
+    open_list: Queue[T] = queue()
+    g_costs: Dict[T, int] = {}
+    parents: Dict[T, T | None] = {}
+    closed: set[T] = set()
+    for start in starts:
+        g_costs[start] = 0
+        parents[start] = None
+        if stats is not None:
+            _record_push(stats, open_list, start)
+        open_list.push(start, estimate(start))
+    while open_list:
+        node = open_list.pop()
+        if node in end_set:
+            return _walk_back(node, parents), g_costs[node]
+        closed.add(node)
+        if stats is not None:
+            stats.stale_pops = open_list.stale_pops
+            stats.expand(node, len(open_list))
+        for neighbor, weight in neighbors(node):
+            if stats is not None:
+                stats.generated += 1
+            g_cost = g_costs[node] + weight
+            if neighbor in closed or g_cost >= g_costs.get(neighbor, g_cost + 1):
+                continue
+            g_costs[neighbor] = g_cost
+            parents[neighbor] = node
+            if stats is not None:
+                _record_push(stats, open_list, neighbor)
+            open_list.push(neighbor, g_cost + estimate(neighbor))
+    raise Exception("No path found")
+
+
+def reverse_graph(
+    starts: Iterable[T],
+    neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+) -> Callable[[T], Iterable[Tuple[T, int]]]:
+    """A predecessor function for every node reachable from ``starts``.
+
+    The reachable graph is explored up front, so prefer a hand-written
+    predecessor function when the edges are easy to invert.
+    """
+    edges: Dict[T, List[Tuple[T, int]]] = {}
+    stack = list(starts)
+    seen = set(stack)
+    while stack:
+        node = stack.pop()
+        for neighbor, weight in neighbors(node):
+            edges.setdefault(neighbor, []).append((node, weight))
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return lambda node: edges.get(node, [])
+
+
+def bidirectional_astar_with_cost(
+    start: T,
+    end: T,
+    heuristic: Callable[[T, T], int],
+    neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+    predecessors: Callable[[T], Iterable[Tuple[T, int]]] | None = None,
+    stats: SearchStats | None = None,
+) -> tuple[List[T], int]:
+    """A* from both ends at once, meeting in the middle.
+
+    Both searches use the average of the forward and backward estimates as
+    their potential, which keeps them consistent with each other when
+    ``heuristic`` is consistent. ``predecessors`` lists the edges into a node;
+    by default it's built with ``reverse_graph``.
+    """
+    if start == end:
+        return [start], 0
+    if predecessors is None:
+        predecessors = reverse_graph([start], neighbors)
+    stats = observe(stats, "bidirectional_astar")
+
+    # Doubled so the averaged potentials stay integers
+    def forward_potential(node: T) -> int:
+        return heuristic(node, end) - heuristic(start, node)
+
+    searches = [
+        (neighbors, forward_potential, start),
+        (predecessors, lambda node: -forward_potential(node), end),
+    ]
+    open_lists: List[PriorityQueue[T]] = [PriorityQueue(), PriorityQueue()]
+    g_costs: List[Dict[T, int]] = [{start: 0}, {end: 0}]
+    parents: List[Dict[T, T | None]] = [{start: None}, {end: None}]
+    closed: List[set[T]] = [set(), set()]
+    for (_, potential, origin), open_list in zip(searches, open_lists):
+        open_list.push(origin, potential(origin))
+
+    best_cost: int | None = None
+    meeting: T | None = None
+    while open_lists[0] and open_lists[1]:
+        tops = [open_list.peek_priority() for open_list in open_lists]
+        if best_cost is not None and tops[0] + tops[1] >= 2 * best_cost:
+            break
+        side = 0 if tops[0] <= tops[1] else 1
+        edges, potential, _ = searches[side]
+        node = open_lists[side].pop()
+        closed[side].add(node)
+        if stats is not None:
+            stats.stale_pops = sum(open_list.stale_pops for open_list in open_lists)
+            stats.expand(node, len(open_lists[0]) + len(open_lists[1]))
+        for neighbor, weight in edges(node):
+            if stats is not None:
+                stats.generated += 1
+            g_cost = g_costs[side][node] + weight
+            if neighbor in closed[side] or g_cost >= g_costs[side].get(
+                neighbor, g_cost + 1
+            ):
+                continue
+            g_costs[side][neighbor] = g_cost
+            parents[side][neighbor] = node
+            if stats is not None:
+                _record_push(stats, open_lists[side], neighbor)
+            open_lists[side].push(neighbor, 2 * g_cost + potential(neighbor))
+            other_cost = g_costs[1 - side].get(neighbor)
+            if other_cost is not None and (
+                best_cost is None or g_cost + other_cost < best_cost
+            ):
+                best_cost = g_cost + other_cost
+                meeting = neighbor
+
+    if best_cost is None or meeting is None:
+        raise Exception("No path found")
+    forward = _walk_back(meeting, parents[0])
+    backward = _walk_back(meeting, parents[1])
+    return forward + list(reversed(backward[:-1])), best_cost
+
+
+UNSEEN = -1
+
+
+@dataclass(frozen=True)
+class IndexedGraph(Generic[T]):
+    """Search over states that map one-to-one onto ``range(size)``.
+
+    Costs, parents and closed flags live in flat ``array``/``bytearray``
+    buffers indexed by ``encode(state)`` and the open list holds plain
+    tuples of ints, so the search itself never hashes a state or
+    allocates a wrapper per push. ``astar``, ``astar_with_cost`` and
+    ``djikstra`` take the same arguments as the module-level functions.
+    """
+
+    size: int
+    encode: Callable[[T], int]
+    decode: Callable[[int], T]
+
+    @staticmethod
+    def grid(lower_right_bound: Point) -> "IndexedGraph[Point]":
+        """Points with ``0 <= x < bound.x`` and ``0 <= y < bound.y``.
+
+        Encoding a point outside the bound raises ``IndexError`` rather than
+        wrapping onto another cell, so neighbours needn't be clipped.
+        """
+        width, height = lower_right_bound.x, lower_right_bound.y
+
+        def encode(p: Point) -> int:
+            if not (0 <= p.x < width and 0 <= p.y < height):
+                raise IndexError(f"{p} is outside {lower_right_bound}")
+            return p.y * width + p.x
+
+        return IndexedGraph(
+            width * height, encode, lambda i: Point(i % width, i // width)
+        )
+
+    def _walk_back(self, index: int, parents: array) -> List[T]:
+        result = [self.decode(index)]
+        while (index := parents[index]) != UNSEEN:
+            result.append(self.decode(index))
+        return list(reversed(result))
+
+    def astar_with_cost(
+        self,
+        start: T,
+        end: T,
+        heuristic: Callable[[T, T], int],
+        neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+        stats: SearchStats | None = None,
+    ) -> tuple[List[T], int]:
+        stats = observe(stats, "indexed_astar")
+        encode = self.encode
+        g_costs = array("q", [UNSEEN]) * self.size
+        parents = array("q", [UNSEEN]) * self.size
+        closed = bytearray(self.size)
+        start_index, end_index = encode(start), encode(end)
+        g_costs[start_index] = 0
+        estimate = heuristic(start, end)
+        open_list = [(estimate, estimate, start_index)]
+        if stats is not None:
+            stats.push(1)
+        while open_list:
+            _, _, index = heappop(open_list)
+            if closed[index]:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+            if index == end_index:
+                return self._walk_back(index, parents), g_costs[index]
+            closed[index] = 1
+            cost = g_costs[index]
+            node = self.decode(index)
+            if stats is not None:
+                stats.expand(node, len(open_list))
+            for neighbor, weight in neighbors(node):
+                if stats is not None:
+                    stats.generated += 1
+                neighbor_index = encode(neighbor)
+                g_cost = cost + weight
+                existing = g_costs[neighbor_index]
+                if existing != UNSEEN and g_cost >= existing:
+                    continue
+                if stats is not None:
+                    if closed[neighbor_index]:
+                        stats.reopened += 1
+                    queued = existing != UNSEEN and not closed[neighbor_index]
+                    stats.push(len(open_list) + 1, queued)
+                g_costs[neighbor_index] = g_cost
+                parents[neighbor_index] = index
+                # Reopen if an inconsistent heuristic closed it too early
+                closed[neighbor_index] = 0
+                estimate = heuristic(neighbor, end)
+                # Break ties towards the node nearest the end
+                heappush(open_list, (g_cost + estimate, estimate, neighbor_index))
+        raise Exception("No path found")
+
+    def astar(
+        self,
+        start: T,
+        end: T,
+        heuristic: Callable[[T, T], int],
+        neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+        stats: SearchStats | None = None,
+    ) -> List[T]:
+        return self.astar_with_cost(start, end, heuristic, neighbors, stats)[0]
+
+    def djikstra(
+        self,
+        start: T,
+        neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+        stats: SearchStats | None = None,
+    ) -> Map[T, int]:
+        stats = observe(stats, "indexed_djikstra")
+        encode = self.encode
+        costs = array("q", [UNSEEN]) * self.size
+        closed = bytearray(self.size)
+        settled: List[int] = []
+        start_index = encode(start)
+        costs[start_index] = 0
+        open_list = [(0, start_index)]
+        if stats is not None:
+            stats.push(1)
+        while open_list:
+            cost, index = heappop(open_list)
+            if closed[index]:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+            closed[index] = 1
+            settled.append(index)
+            node = self.decode(index)
+            if stats is not None:
+                stats.expand(node, len(open_list))
+            for neighbor, weight in neighbors(node):
+                if stats is not None:
+                    stats.generated += 1
+                neighbor_index = encode(neighbor)
+                g_cost = cost + weight
+                existing = costs[neighbor_index]
+                if closed[neighbor_index] or (
+                    existing != UNSEEN and g_cost >= existing
+                ):
+                    continue
+                if stats is not None:
+                    stats.push(len(open_list) + 1, existing != UNSEEN)
+                costs[neighbor_index] = g_cost
+                heappush(open_list, (g_cost, neighbor_index))
+        return Map({self.decode(index): costs[index] for index in settled})
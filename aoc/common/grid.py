@@ -1,5 +1,15 @@
 from dataclasses import dataclass
-from typing import Callable, Generic, TypeVar
+from functools import cache
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    TypeVar,
+)
 
 from immutables import Map
 
@@ -34,3 +44,218 @@ class Grid(Generic[T]):
                 result[Point(col, row)] = convert(value)
         assert row is not None and col is not None
         return cls(Map(result), Point(col + 1, row + 1))
+
+
+class GridEntries(Mapping[Point, T]):
+    """Read-only ``Point -> value`` mapping over a dense rectangle of cells.
+
+    Each cell is one byte of ``cells``, in row-major order, holding an index
+    into ``palette``, the grid's distinct values. A lookup is a bounds check
+    and two list indexes: no ``Point`` is hashed. It mirrors the parts of
+    ``immutables.Map`` that grids use, ``mutate()`` included.
+    """
+
+    __slots__ = ("cells", "palette", "width", "height")
+
+    def __init__(self, cells: bytearray, palette: List[T], width: int, height: int):
+        self.cells = cells
+        self.palette = palette
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_mapping(
+        cls, entries: Mapping[Point, T], lower_right_bound: Point
+    ) -> "GridEntries[T]":
+        width, height = lower_right_bound.x, lower_right_bound.y
+        if len(entries) != width * height:
+            raise ValueError(f"A dense grid needs all {width}x{height} cells")
+        palette: List[T] = []
+        codes: Dict[T, int] = {}
+        cells = bytearray(width * height)
+        for point, value in entries.items():
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = _add_to_palette(palette, value)
+            cells[point.y * width + point.x] = code
+        return cls(cells, palette, width, height)
+
+    def __getitem__(self, point: Point) -> T:
+        x, y = point.x, point.y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.palette[self.cells[y * self.width + x]]
+        raise KeyError(point)
+
+    def __contains__(self, point: object) -> bool:
+        return (
+            isinstance(point, Point)
+            and 0 <= point.x < self.width
+            and 0 <= point.y < self.height
+        )
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(_points(self.width, self.height))
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def items(self) -> Iterator[Tuple[Point, T]]:  # type: ignore[override]
+        return zip(
+            _points(self.width, self.height), map(self.palette.__getitem__, self.cells)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GridEntries) and other.palette == self.palette:
+            return other.width == self.width and other.cells == self.cells
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash((self.width, tuple(self.palette[code] for code in self.cells)))
+
+    def mutate(self) -> "GridMutation[T]":
+        return GridMutation(self)
+
+
+class GridMutation(Generic[T]):
+    """A copy of some ``GridEntries`` to change, like ``Map.mutate()``.
+
+    ``finish`` hands over the cells and palette, so like a ``MapMutation``
+    it can't be changed after that.
+    """
+
+    def __init__(self, entries: GridEntries[T]):
+        self.cells = bytearray(entries.cells)
+        self.palette = list(entries.palette)
+        self.codes = {value: code for code, value in enumerate(self.palette)}
+        self.width = entries.width
+        self.height = entries.height
+        self.finished = False
+
+    def __enter__(self) -> "GridMutation[T]":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.finish()
+
+    def __getitem__(self, point: Point) -> T:
+        x, y = point.x, point.y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.palette[self.cells[y * self.width + x]]
+        raise KeyError(point)
+
+    def __setitem__(self, point: Point, value: T) -> None:
+        if self.finished:
+            raise ValueError(f"mutation {self!r} has been finished")
+        x, y = point.x, point.y
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise KeyError(point)
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = _add_to_palette(self.palette, value)
+        self.cells[y * self.width + x] = code
+
+    def finish(self) -> GridEntries[T]:
+        self.finished = True
+        return GridEntries(self.cells, self.palette, self.width, self.height)
+
+
+@cache
+def _points(width: int, height: int) -> Tuple[Point, ...]:
+    """Every point of a grid in row-major order, shared between grids."""
+    return tuple(Point(x, y) for y in range(height) for x in range(width))
+
+
+def _add_to_palette(palette: List[T], value: T) -> int:
+    if len(palette) == 256:
+        raise ValueError("A dense grid holds at most 256 distinct values")
+    palette.append(value)
+    return len(palette) - 1
+
+
+@dataclass(frozen=True)
+class DenseGrid(Grid[T]):
+    """A ``Grid`` whose ``entries`` are a ``GridEntries`` rather than a
+    ``Map``, for puzzles whose every cell is filled in.
+
+    Subclasses of ``Grid`` can switch to it without other changes: it's
+    built, read and mutated the same way, and a ``Map`` (or any other
+    mapping) passed in is converted. ``array`` and ``neighbor_masks`` expose
+    the cells to NumPy.
+    """
+
+    entries: GridEntries[T]  # type: ignore[assignment]
+
+    def __init__(self, entries: Mapping[Point, T], lower_right_bound: Point):
+        if not isinstance(entries, GridEntries):
+            entries = GridEntries.from_mapping(entries, lower_right_bound)
+        object.__setattr__(self, "entries", entries)
+        object.__setattr__(self, "lower_right_bound", lower_right_bound)
+
+    @classmethod
+    def parse(cls, text: str, convert: Callable[[str], T]):
+        lines = text.splitlines()
+        width, height = len(lines[0]), len(lines)
+        if any(len(line) != width for line in lines):
+            raise ValueError("A dense grid needs lines of equal length")
+        joined = "".join(lines)
+        palette: List[T] = []
+        codes: Dict[T, int] = {}
+        table: Dict[int, str] = {}
+        for char in dict.fromkeys(joined):
+            value = convert(char)
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = _add_to_palette(palette, value)
+            table[ord(char)] = chr(code)
+        cells = bytearray(joined.translate(table), "latin-1")
+        return cls(GridEntries(cells, palette, width, height), Point(width, height))
+
+    @classmethod
+    def from_grid(cls, grid: Grid[T]) -> "DenseGrid[T]":
+        return cls(grid.entries, grid.lower_right_bound)
+
+    def to_grid(self) -> Grid[T]:
+        return Grid(Map(self.entries.items()), self.lower_right_bound)
+
+    @property
+    def array(self):
+        """The cells as a ``(height, width)`` NumPy array of palette indexes,
+        sharing memory with the grid.
+        """
+        import numpy as np
+
+        return np.frombuffer(self.entries.cells, dtype=np.uint8).reshape(
+            self.lower_right_bound.y, self.lower_right_bound.x
+        )
+
+    def mask(self, value: T):
+        """A boolean array of the cells holding ``value``."""
+        import numpy as np
+
+        if value not in self.entries.palette:
+            return np.zeros(self.array.shape, dtype=bool)
+        return self.array == self.entries.palette.index(value)
+
+    def neighbor_masks(self, value: T | None = None):
+        """A ``(4, height, width)`` boolean array, one layer per direction of
+        ``CHAR_TO_DIRECTION_LIST`` (up, right, down, left), true where the
+        neighbour that way holds ``value``. Without ``value``, true where the
+        neighbour matches the cell itself. Off-grid neighbours never match.
+        """
+        import numpy as np
+
+        cells = self.array
+        match = self.mask(value) if value is not None else None
+        result = np.zeros((4,) + cells.shape, dtype=bool)
+        # (layer, cells being compared, their neighbours in that direction)
+        for layer, here, there in [
+            (0, np.s_[1:, :], np.s_[:-1, :]),
+            (1, np.s_[:, :-1], np.s_[:, 1:]),
+            (2, np.s_[:-1, :], np.s_[1:, :]),
+            (3, np.s_[:, 1:], np.s_[:, :-1]),
+        ]:
+            if match is None:
+                result[layer][here] = cells[here] == cells[there]
+            else:
+                result[layer][here] = match[there]
+        return result
@@ -1,49 +1,457 @@
 from dataclasses import dataclass, field
-from heapq import heappop, heappush
-from typing import Dict, Generic, List, TypeVar
+from heapq import heapify, heappop, heappush
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
 
-@dataclass(order=True)
-class PrioritizedItem(Generic[T]):
-    priority: int
-    item: T = field(compare=False)
-    is_removed: bool = field(default=False, compare=False)
+class Queue(Protocol[T]):
+    """What the searches in ``aoc.common.graph`` need from a priority queue."""
+
+    stale_pops: int
+
+    def push(self, item: T, priority: int) -> None: ...
+
+    def push_many(self, entries: Iterable[Tuple[T, int]]) -> None: ...
+
+    def pop(self) -> T: ...
+
+    def pop_with_priorty(self) -> tuple[T, int]: ...
+
+    def peek_priority(self) -> int: ...
+
+    def remove(self, item: T) -> None: ...
+
+    def __contains__(self, item: T) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+
+# Entries are [priority, insertion count, item]. The count breaks ties so
+# items themselves are never compared, and an entry that was removed or whose
+# priority has changed is marked stale by replacing its item.
+_STALE: Any = object()
+# Heaps smaller than this are never worth compacting
+_MIN_COMPACT_SIZE = 1024
 
 
 @dataclass
 class PriorityQueue(Generic[T]):
-    _items: List[PrioritizedItem[T]] = field(default_factory=list)
-    _entries: Dict[T, PrioritizedItem[T]] = field(default_factory=dict)
+    """Min-heap over ``heapq`` with lazy deletion.
+
+    Removing an item or changing its priority leaves a stale entry behind to
+    be skipped when popped. Once more than ``max_stale_ratio`` of the heap is
+    stale it's rebuilt from the live entries alone.
+    """
+
+    _items: List[List[Any]] = field(default_factory=list)
+    _entries: Dict[T, List[Any]] = field(default_factory=dict)
+    _count: int = 0
+    _stale: int = 0
+    max_stale_ratio: float = 0.5
+    stale_pops: int = 0
 
     def push(self, item: T, priority: int) -> None:
-        if item in self._entries:
-            existing_entry = self._entries[item]
-            if existing_entry.priority == priority:
+        existing_entry = self._entries.get(item)
+        if existing_entry is not None:
+            if existing_entry[0] == priority:
                 return
-            existing_entry.is_removed = True
-            item = existing_entry.item
-        envelope = PrioritizedItem(priority, item)
-        self._entries[item] = envelope
-        heappush(self._items, envelope)
+            self._mark_stale(existing_entry)
+        self._count += 1
+        entry = [priority, self._count, item]
+        self._entries[item] = entry
+        heappush(self._items, entry)
+
+    def push_many(self, entries: Iterable[Tuple[T, int]]) -> None:
+        """Push every ``(item, priority)``, the last priority winning for an
+        item given twice. A batch large next to the heap is merged with one
+        O(n) ``heapify`` instead of a ``heappush`` each.
+        """
+        batch = []
+        queued = self._entries
+        first_new = self._count + 1
+        for item, priority in entries:
+            existing_entry = queued.get(item)
+            if existing_entry is not None:
+                if existing_entry[0] == priority:
+                    continue
+                if existing_entry[1] >= first_new:
+                    # Not in the heap yet, so it can simply be updated
+                    existing_entry[0] = priority
+                    continue
+                self._mark_stale(existing_entry)
+            self._count += 1
+            entry = [priority, self._count, item]
+            queued[item] = entry
+            batch.append(entry)
+        if 8 * len(batch) >= len(self._items):
+            self._items.extend(batch)
+            heapify(self._items)
+        else:
+            for entry in batch:
+                heappush(self._items, entry)
 
     def pop(self) -> T:
         return self.pop_with_priorty()[0]
 
+    def pop_many(self, count: int) -> List[tuple[T, int]]:
+        """Up to ``count`` items with their priorities, lowest first."""
+        result = []
+        while len(result) < count and self._entries:
+            result.append(self.pop_with_priorty())
+        return result
+
+    def drain(self) -> Iterator[tuple[T, int]]:
+        """Pop items with their priorities until the queue is empty, including
+        any pushed while draining.
+        """
+        while self._entries:
+            yield self.pop_with_priorty()
+
     def pop_with_priorty(self) -> tuple[T, int]:
         while self._items:
-            item = heappop(self._items)
-            if not item.is_removed:
-                del self._entries[item.item]
-                return item.item, item.priority
+            priority, _, item = heappop(self._items)
+            if item is not _STALE:
+                del self._entries[item]
+                return item, priority
+            self._stale -= 1
+            self.stale_pops += 1
         raise Exception("Pop from empty queue")
 
+    def peek_priority(self) -> int:
+        while self._items and self._items[0][2] is _STALE:
+            heappop(self._items)
+            self._stale -= 1
+            self.stale_pops += 1
+        if not self._items:
+            raise Exception("Peek at empty queue")
+        return self._items[0][0]
+
     def remove(self, item: T) -> None:
-        self._entries[item].is_removed = True
+        self._mark_stale(self._entries.pop(item))
+
+    def _mark_stale(self, entry: List[Any]) -> None:
+        entry[2] = _STALE
+        self._stale += 1
+        if len(
+            self._items
+        ) >= _MIN_COMPACT_SIZE and self._stale > self.max_stale_ratio * len(
+            self._items
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop every stale entry from the heap."""
+        self._items = [entry for entry in self._items if entry[2] is not _STALE]
+        heapify(self._items)
+        self._stale = 0
+
+    @property
+    def stale_ratio(self) -> float:
+        """The fraction of the heap taken up by stale entries."""
+        return self._stale / len(self._items) if self._items else 0.0
+
+    @property
+    def heap_size(self) -> int:
+        """Entries held, stale ones included."""
+        return len(self._items)
 
     def __contains__(self, item: T) -> bool:
-        return item in self._entries and not self._entries[item].is_removed
+        return item in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
     def __bool__(self) -> bool:
         return bool(self._entries)
+
+
+@dataclass
+class IndexedPriorityQueue(Generic[T]):
+    """Binary min-heap that tracks each item's position, so a priority change
+    moves the item in place instead of leaving a stale entry behind.
+
+    Priorities and items live in parallel lists. The heap never holds more
+    than the live items, at the cost of sifting in Python rather than in
+    ``heapq``'s C code.
+    """
+
+    _priorities: List[int] = field(default_factory=list)
+    _items: List[T] = field(default_factory=list)
+    _positions: Dict[T, int] = field(default_factory=dict)
+    # Always 0; kept so it can stand in for ``PriorityQueue``
+    stale_pops: int = 0
+
+    def push(self, item: T, priority: int) -> None:
+        position = self._positions.get(item)
+        if position is None:
+            self._priorities.append(priority)
+            self._items.append(item)
+            self._sift_up(len(self._items) - 1)
+            return
+        current = self._priorities[position]
+        self._priorities[position] = priority
+        if priority < current:
+            self._sift_up(position)
+        elif priority > current:
+            self._sift_down(position)
+
+    def push_many(self, entries: Iterable[Tuple[T, int]]) -> None:
+        for item, priority in entries:
+            self.push(item, priority)
+
+    def pop(self) -> T:
+        return self.pop_with_priorty()[0]
+
+    def pop_with_priorty(self) -> tuple[T, int]:
+        if not self._items:
+            raise Exception("Pop from empty queue")
+        item, priority = self._items[0], self._priorities[0]
+        self._take(0)
+        return item, priority
+
+    def peek_priority(self) -> int:
+        if not self._items:
+            raise Exception("Peek at empty queue")
+        return self._priorities[0]
+
+    def remove(self, item: T) -> None:
+        self._take(self._positions[item])
+
+    def _take(self, position: int) -> None:
+        """Remove the entry at ``position``, filling the gap with the last."""
+        del self._positions[self._items[position]]
+        last_item, last_priority = self._items.pop(), self._priorities.pop()
+        if position == len(self._items):
+            return
+        self._items[position] = last_item
+        self._priorities[position] = last_priority
+        self._positions[last_item] = position
+        self._sift_down(position)
+        self._sift_up(self._positions[last_item])
+
+    def _sift_up(self, position: int) -> None:
+        priorities, items, positions = self._priorities, self._items, self._positions
+        priority, item = priorities[position], items[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            priorities[position] = priorities[parent]
+            items[position] = items[parent]
+            positions[items[position]] = position
+            position = parent
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+    def _sift_down(self, position: int) -> None:
+        priorities, items, positions = self._priorities, self._items, self._positions
+        size = len(items)
+        priority, item = priorities[position], items[position]
+        child = 2 * position + 1
+        while child < size:
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+            priorities[position] = priorities[child]
+            items[position] = items[child]
+            positions[items[position]] = position
+            position = child
+            child = 2 * position + 1
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+    @property
+    def heap_size(self) -> int:
+        """Entries held, stale ones included."""
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._positions
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+
+@dataclass
+class BucketQueue(Generic[T]):
+    """Monotone queue for non-negative integer priorities (Dial's algorithm).
+
+    Each priority gets its own bucket and popping walks upward from the last
+    priority popped, so push and pop are O(1) plus one step per empty
+    priority skipped. Suited to small edge weights, such as a grid's unit
+    steps. Priorities may never drop below the last one popped, which holds
+    for Dijkstra and for A* with a consistent heuristic.
+    """
+
+    _buckets: Dict[int, List[T]] = field(default_factory=dict)
+    _priorities: Dict[T, int] = field(default_factory=dict)
+    _current: int = 0
+    stale_pops: int = 0
+
+    def push(self, item: T, priority: int) -> None:
+        if priority < self._current:
+            raise ValueError(
+                f"Priority {priority} is below the last popped, {self._current}"
+            )
+        if self._priorities.get(item) == priority:
+            return
+        # Any entry at the old priority goes stale
+        self._priorities[item] = priority
+        self._buckets.setdefault(priority, []).append(item)
+
+    def push_many(self, entries: Iterable[Tuple[T, int]]) -> None:
+        for item, priority in entries:
+            self.push(item, priority)
+
+    def pop(self) -> T:
+        return self.pop_with_priorty()[0]
+
+    def pop_with_priorty(self) -> tuple[T, int]:
+        priorities, current = self._priorities, self._current
+        bucket = self._buckets.get(current)
+        while bucket:
+            item = bucket.pop()
+            if priorities.get(item) == current:
+                del priorities[item]
+                return item, current
+            self.stale_pops += 1
+        current = self.peek_priority()
+        item = self._buckets[current].pop()
+        del priorities[item]
+        return item, current
+
+    def peek_priority(self) -> int:
+        if not self._priorities:
+            raise Exception("Peek at empty queue")
+        while True:
+            bucket = self._buckets.get(self._current)
+            while bucket:
+                if self._priorities.get(bucket[-1]) == self._current:
+                    return self._current
+                bucket.pop()
+                self.stale_pops += 1
+            self._buckets.pop(self._current, None)
+            self._current += 1
+
+    def remove(self, item: T) -> None:
+        del self._priorities[item]
+
+    @property
+    def heap_size(self) -> int:
+        """Entries held, stale ones included."""
+        return sum(map(len, self._buckets.values()))
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._priorities
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+    def __bool__(self) -> bool:
+        return bool(self._priorities)
+
+
+@dataclass
+class RadixHeap(Generic[T]):
+    """Monotone queue for non-negative integer priorities.
+
+    Entries are bucketed by the highest bit in which their priority differs
+    from the last one popped. When the lowest bucket runs dry the next
+    non-empty bucket is spread over the ones below it, and each entry can
+    only move down ``log(C)`` times, where ``C`` is the largest edge weight.
+    Unlike ``BucketQueue`` there's no cost for gaps between priorities, so it
+    suits mixed weights like 2024 day 16's 1 and 1000. The same monotone
+    rule applies.
+    """
+
+    _buckets: List[List[Tuple[int, T]]] = field(default_factory=lambda: [[]])
+    _priorities: Dict[T, int] = field(default_factory=dict)
+    _last: int = 0
+    stale_pops: int = 0
+
+    def push(self, item: T, priority: int) -> None:
+        if priority < self._last:
+            raise ValueError(
+                f"Priority {priority} is below the last popped, {self._last}"
+            )
+        if self._priorities.get(item) == priority:
+            return
+        self._priorities[item] = priority
+        self._bucket(priority).append((priority, item))
+
+    def _bucket(self, priority: int) -> List[Tuple[int, T]]:
+        index = (priority ^ self._last).bit_length()
+        while len(self._buckets) <= index:
+            self._buckets.append([])
+        return self._buckets[index]
+
+    def push_many(self, entries: Iterable[Tuple[T, int]]) -> None:
+        for item, priority in entries:
+            self.push(item, priority)
+
+    def pop(self) -> T:
+        return self.pop_with_priorty()[0]
+
+    def pop_with_priorty(self) -> tuple[T, int]:
+        priority = self.peek_priority()
+        _, item = self._buckets[0].pop()
+        del self._priorities[item]
+        return item, priority
+
+    def peek_priority(self) -> int:
+        if not self._priorities:
+            raise Exception("Peek at empty queue")
+        priorities = self._priorities
+        lowest = self._buckets[0]
+        while lowest and priorities.get(lowest[-1][1]) != lowest[-1][0]:
+            lowest.pop()
+            self.stale_pops += 1
+        if lowest:
+            return self._last
+        live: List[Tuple[int, T]] = []
+        for bucket in self._buckets[1:]:
+            live = [entry for entry in bucket if priorities.get(entry[1]) == entry[0]]
+            self.stale_pops += len(bucket) - len(live)
+            bucket.clear()
+            if live:
+                break
+        if not live:
+            raise Exception("No live entries left for the queued items")
+        self._last = min(priority for priority, _ in live)
+        for priority, item in live:
+            self._bucket(priority).append((priority, item))
+        return self._last
+
+    def remove(self, item: T) -> None:
+        del self._priorities[item]
+
+    @property
+    def heap_size(self) -> int:
+        """Entries held, stale ones included."""
+        return sum(map(len, self._buckets))
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._priorities
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+    def __bool__(self) -> bool:
+        return bool(self._priorities)
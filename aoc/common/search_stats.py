@@ -0,0 +1,97 @@
+"""Counters for what a graph search did, optionally collected per run.
+
+Every search in ``aoc.common.graph`` accepts an optional ``SearchStats``.
+Passing one in lets a caller inspect that search. ``collect_search_stats``
+instead gathers stats for every search started inside it, which is how
+``aoc solve --profile`` reports search work without solutions opting in.
+Hand-rolled searches can join in by calling ``observe``.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List
+
+_collector: ContextVar[List["SearchStats"] | None] = ContextVar(
+    "search_stats_collector", default=None
+)
+
+
+@dataclass
+class SearchStats:
+    """Counters updated by a search as it runs.
+
+    The open-list size is recorded every ``open_size_every`` expansions and
+    the ``repr`` of every ``sample_every``-th expanded state is kept, up to
+    ``max_samples``. Either can be turned off with 0.
+    """
+
+    label: str = "search"
+    open_size_every: int = 100
+    sample_every: int = 0
+    max_samples: int = 1000
+    expanded: int = 0
+    generated: int = 0
+    pushes: int = 0
+    decrease_keys: int = 0
+    reopened: int = 0
+    stale_pops: int = 0
+    pruned: int = 0
+    peak_open: int = 0
+    open_sizes: List[int] = field(default_factory=list)
+    samples: List[str] = field(default_factory=list)
+
+    def expand(self, node: Any, open_size: int) -> None:
+        self.expanded += 1
+        if self.open_size_every and self.expanded % self.open_size_every == 0:
+            self.open_sizes.append(open_size)
+        if (
+            self.sample_every
+            and self.expanded % self.sample_every == 0
+            and len(self.samples) < self.max_samples
+        ):
+            self.samples.append(repr(node))
+
+    def push(self, open_size: int, decrease_key: bool = False) -> None:
+        self.pushes += 1
+        if decrease_key:
+            self.decrease_keys += 1
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+
+    def push_many(self, open_size: int, count: int, decrease_keys: int = 0) -> None:
+        """Count ``count`` pushes made at once, leaving ``open_size`` queued."""
+        self.pushes += count
+        self.decrease_keys += decrease_keys
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+
+    def to_json(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def observe(
+    stats: SearchStats | None = None, label: str = "search"
+) -> SearchStats | None:
+    """The stats a search should update: ``stats`` if given, otherwise fresh
+    stats when ``collect_search_stats`` is active, otherwise None.
+    """
+    collected = _collector.get()
+    if collected is None:
+        return stats
+    if stats is None:
+        stats = SearchStats(label)
+    if not any(existing is stats for existing in collected):
+        collected.append(stats)
+    return stats
+
+
+@contextmanager
+def collect_search_stats() -> Iterator[List[SearchStats]]:
+    """Gather the stats of every search run inside the block."""
+    collected: List[SearchStats] = []
+    token = _collector.set(collected)
+    try:
+        yield collected
+    finally:
+        _collector.reset(token)
@@ -1,17 +1,17 @@
-import os
-import textwrap
+import time
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import click
-import requests
-import yaml
-from anthropic import Anthropic
-from bs4 import BeautifulSoup, Tag
-from bs4.element import NavigableString
 
-from aoc.utils.finder import get_days
+from aoc.utils.finder import get_day, get_days
+
+if TYPE_CHECKING:
+    from aoc.utils.runner import Task
+    from aoc.utils.sandbox import Limits
 
 
 @click.group()
@@ -19,268 +19,450 @@ def cli() -> None:
     pass
 
 
-PARSE_QUESTION_PROMPT = """
-Extract the example test case from the Advent of Code problem and format it as YAML.
-
-<instructions>
-1. Find the example input in the problem (usually in a code block or after "For example:")
-2. Find the expected answer(s) for the example (usually stated as "the answer is X")
-3. Format as YAML with two fields: `input` and `answers`
-
-Rules:
-- Use YAML literal block scalar format `|-` to preserve exact formatting
-- If part 1 and part 2 use the SAME example input: use a single string for `input`
-- If part 1 and part 2 use DIFFERENT example inputs: use a list with two strings for `input`
-- If only one part exists, provide only one answer
-- Preserve all whitespace, newlines, and formatting exactly as shown
-- Answers should be simple values (numbers or strings)
-</instructions>
-
-<examples>
-<example name="Same input for both parts">
-```yaml
-input: |-
-  Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
-  Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
-  Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
-  Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
-  Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green
-answers:
-- 8
-- 2286
-```
-</example>
-
-<example name="Different inputs for each part">
-```yaml
-input:
-  - |-
-    1abc2
-    pqr3stu8vwx
-    a1b2c3d4e5f
-    treb7uchet
-  - |-
-    two1nine
-    eightwothree
-    abcone2threexyz
-    xtwone3four
-    4nineeightseven2
-    zoneight234
-    7pqrstsixteen
-answers:
-- 142
-- 281
-```
-</example>
-</examples>
-
-Extract the test case from the problem in <advent_of_code_problem> tags above and output only the YAML in a code block.
-"""
-
-
-def parse_article(soup: Tag, width: int = 80) -> str:
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-
-    # Add newlines around headings
-    for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6", "p"]):
-        heading.insert_after("\n")
-
-    # Convert lists to markdown format
-    for list_tag in soup.find_all(["ul", "ol"]):
-        is_ordered = list_tag.name == "ol"
-        for i, item in enumerate(list_tag.find_all("li", recursive=False), 1):
-            # Determine list marker
-            if is_ordered:
-                marker = f"  {i}. "
-            else:
-                marker = "  * "
+@cli.command()
+@click.option("--day", default=None, help="Day to run, defaults to latest", type=int)
+@click.option("--year", default=None, help="Year to run, defaults to latest", type=int)
+@click.option(
+    "--days",
+    "day_range",
+    default=None,
+    help="Run a range of days in parallel, e.g. 1-25 or 1,3,5-7",
+)
+@click.option("--all", "run_all", is_flag=True, help="Run every solved day in parallel")
+@click.option(
+    "--jobs", default=None, help="Worker processes, defaults to CPU count", type=int
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Report wall time, CPU time, memory and parse time for each part",
+)
+@click.option(
+    "--profile-json",
+    default=None,
+    help="Also write the profile report to this JSON file",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option("--no-cache", is_flag=True, help="Ignore and don't update cached answers")
+@click.option(
+    "--timeout",
+    default=None,
+    help="Kill any part still running after this many seconds",
+    type=float,
+)
+@click.option(
+    "--max-memory",
+    default=None,
+    help="Cap each part's memory at this many MB",
+    type=int,
+)
+@click.option(
+    "--parallel",
+    is_flag=True,
+    help="Run part 1 and part 2 at the same time in separate processes",
+)
+def solve(
+    day: int | None,
+    year: int | None = None,
+    day_range: str | None = None,
+    run_all: bool = False,
+    jobs: int | None = None,
+    profile: bool = False,
+    profile_json: Path | None = None,
+    no_cache: bool = False,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+    parallel: bool = False,
+) -> None:
+    from aoc.utils.runner import Task, build_tasks, parse_day_range
+    from aoc.utils.sandbox import Limits, run_sandboxed
+
+    profile = profile or profile_json is not None
+    limits = Limits(timeout, max_memory * 1024 * 1024 if max_memory else None)
+    if profile and limits:
+        # Profiled parts run in their own workers, which don't enforce limits
+        raise click.BadParameter(
+            "--timeout and --max-memory can't be combined with --profile"
+        )
+    if run_all or day_range:
+        if year is None and not run_all:
+            year = datetime.now(ZoneInfo("America/New_York")).year
+        tasks = build_tasks(
+            [year] if year else None,
+            parse_day_range(day_range) if day_range else None,
+        )
+        if not tasks:
+            raise click.BadParameter("No solutions match the selected days")
+        print(f"🎄 Running {len(tasks)} parts 🎄")
+        solve_batch(tasks, jobs, profile, profile_json, no_cache, limits)
+        return
 
-            # Add marker to beginning of list item
-            if item.string and isinstance(item.string, NavigableString):
-                item.string.replace_with(marker + item.string)
+    now = datetime.now(ZoneInfo("America/New_York"))
+    year = year or now.year
+    if day:
+        current_day = get_day(year, day)
+        if current_day is None:
+            raise click.BadParameter(f"No solution yet for {day}")
+    else:
+        current_day = get_days([year])[-1]
+
+    if profile:
+        print(f"🎄 Advent of Code {year}: Day {current_day.day_number} 🎄")
+        tasks = [Task(year, current_day.day_number, part) for part in (1, 2)]
+        solve_batch(tasks, jobs, profile, profile_json, no_cache)
+        return
+
+    from aoc.utils.cache import AnswerCache
+    from aoc.utils.runner import TaskResult, run_parsed, run_task
+
+    cache = None if no_cache else AnswerCache()
+    tasks = [Task(year, current_day.day_number, part) for part in (1, 2)]
+    results: dict[int, TaskResult] = {}
+    for task in tasks:
+        cached = cache.get(task) if cache else None
+        if cached is not None:
+            results[task.part] = cached
+    pending = [task for task in tasks if task.part not in results]
+
+    if pending:
+        with ExitStack() as stack:
+            # A parse hook runs once and both parts share its result; without
+            # one each part gets its own (possibly streamed) copy of the input.
+            # Limited parts each run in a sandbox process that reads its own.
+            shared = None
+            if current_day.has_parse_hook and not limits:
+                shared = stack.enter_context(current_day.prepared_input(1))
+            if parallel and len(pending) > 1 and limits:
+                for result in run_sandboxed(pending, len(pending), limits):
+                    results[result.task.part] = result
+            elif parallel and len(pending) > 1:
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor(max_workers=len(pending)) as executor:
+                    futures = [
+                        executor.submit(run_parsed, task, shared)
+                        if current_day.has_parse_hook
+                        else executor.submit(run_task, task)
+                        for task in pending
+                    ]
+                    for future in futures:
+                        result = future.result()
+                        results[result.task.part] = result
             else:
-                item.insert(0, marker)
-
-    # Get text and wrap each line
-    text = soup.get_text()
-    wrapped_lines = [textwrap.fill(line, width=width) for line in text.splitlines()]
-
-    return "\n".join(wrapped_lines)
+                for task in pending:
+                    if task.part == 2 and results[1].answer is None:
+                        break
+                    if limits:
+                        (results[task.part],) = run_sandboxed([task], 1, limits)
+                        continue
+                    if current_day.has_parse_hook:
+                        results[task.part] = run_parsed(task, shared)
+                        continue
+                    with current_day.prepared_input(task.part) as parsed:
+                        results[task.part] = run_parsed(task, parsed)
+        if cache:
+            for task in pending:
+                if task.part in results:
+                    cache.put(results[task.part])
 
+    print(f"🎄 Advent of Code {year}: Day {current_day.day_number} 🎄")
+    part1 = results[1]
+    print(
+        f"Part 1{' (cached)' if part1.cached else ''}:\n{part1.error or part1.answer}\n\n"
+    )
+    if part1.answer is not None and 2 in results:
+        part2 = results[2]
+        print(
+            f"Part 2{' (cached)' if part2.cached else ''}:\n{part2.error or part2.answer}"
+        )
+    if cache:
+        print(f"\nCache: {cache.hits} hits, {cache.misses} misses")
 
-def convert_to_plain_text(response_text: str, width: int = 80) -> str:
-    # Parse HTML
-    soup = BeautifulSoup(response_text, "html.parser")
 
-    articles = soup.find_all("article")
-    result = ""
-    for soup in articles:
-        if not isinstance(soup, Tag):
-            raise Exception("Could not find article tag in HTML")
-        result += parse_article(soup, width=width) + "\n"
-    return result.strip() + "\n"
+def summarize_answer(answer: str | None, width: int = 40) -> str:
+    if answer is None:
+        return "None"
+    if "\n" in answer:
+        return f"<{len(answer.splitlines())} lines>"
+    return answer if len(answer) <= width else answer[: width - 3] + "..."
+
+
+def solve_batch(
+    tasks: list["Task"],
+    jobs: int | None,
+    profile: bool = False,
+    profile_json: Path | None = None,
+    no_cache: bool = False,
+    limits: "Limits | None" = None,
+) -> None:
+    from aoc.utils.cache import AnswerCache
+    from aoc.utils.runner import run_tasks
+    from aoc.utils.sandbox import run_sandboxed
+    from aoc.utils.table import format_table
+
+    if profile:
+        profile_tasks(tasks, jobs, profile_json)
+        return
+
+    start = time.perf_counter()
+    cache = None if no_cache else AnswerCache()
+    results = []
+    pending = []
+    for task in tasks:
+        cached = cache.get(task) if cache else None
+        if cached is None:
+            pending.append(task)
+        else:
+            results.append(cached)
+            print(f"{task}: {cached.answer} (cached)", flush=True)
+    if not pending:
+        completed = iter([])
+    elif limits:
+        completed = run_sandboxed(pending, jobs, limits)
+    else:
+        completed = run_tasks(pending, jobs)
+    for result in completed:
+        results.append(result)
+        if cache:
+            cache.put(result)
+        status = result.error or result.answer
+        print(f"{result.task}: {status} ({result.wall_time:.3f}s)", flush=True)
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda x: x.task)
+    print()
+    print(
+        format_table(
+            ["Year", "Day", "Part", "Answer", "Time (s)"],
+            [
+                [
+                    r.task.year,
+                    r.task.day,
+                    r.task.part,
+                    r.error.split(":")[0] if r.error else summarize_answer(r.answer),
+                    f"{r.wall_time:.3f}" + (" (cached)" if r.cached else ""),
+                ]
+                for r in results
+            ],
+        )
+    )
+    total = sum(r.wall_time for r in results if not r.cached)
+    print(f"\nWall time: {elapsed:.3f}s (sum of parts: {total:.3f}s)")
+    if cache:
+        print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+
+
+def profile_tasks(
+    tasks: list["Task"], jobs: int | None, profile_json: Path | None
+) -> None:
+    from aoc.utils.profiler import (
+        PROFILE_HEADERS,
+        profile_part,
+        profile_rows,
+        write_profiles_json,
+    )
+    from aoc.utils.runner import run_tasks
+    from aoc.utils.table import format_table
+
+    profiles = []
+    for result in run_tasks(tasks, jobs, profile_part, fresh_process=True):
+        profiles.append(result)
+        status = result.error or result.answer
+        print(f"{result.task}: {status} ({result.wall_time:.3f}s)", flush=True)
+    profiles.sort(key=lambda x: x.task)
+    print()
+    print(format_table(PROFILE_HEADERS, profile_rows(profiles)))
+    if profile_json is not None:
+        write_profiles_json(profiles, profile_json)
+        print(f"\nWrote profile to {profile_json}")
 
 
-def infer_return_type(answer: object) -> str:
-    """Infer the Python type annotation from an answer value."""
-    if answer is None:
-        return "str"
-    if isinstance(answer, int):
-        return "int"
-    return "str"
-
-
-def get_test_yaml_from_problem(problem_text: str) -> str:
-    anthropic_api_key = os.getenv("ANTHROPIC_API_KEY", "")
-    default_answer = textwrap.dedent("""\
-        input: |-
-
-        answers:
-        -
-    """)
-    if not anthropic_api_key:
-        return default_answer
-    yaml_lead_in = "input:"
-    anthropic_client = Anthropic(api_key=anthropic_api_key)
-    response = anthropic_client.messages.create(
-        max_tokens=1024,
-        messages=[
-            {
-                "role": "user",
-                "content": f"<advent_of_code_problem>\n{problem_text}\n<advent_of_code_problem>",
-            },
-            {
-                "role": "user",
-                "content": PARSE_QUESTION_PROMPT,
-            },
-            {"role": "assistant", "content": f"```yaml\n{yaml_lead_in}"},
-        ],
-        model="claude-haiku-4-5",
+@cli.command()
+@click.option("--year", default=None, help="Year to benchmark", type=int)
+@click.option("--days", "day_range", default=None, help="Days, e.g. 1-25 or 1,3,5-7")
+@click.option("--all", "run_all", is_flag=True, help="Benchmark every solved day")
+@click.option("--part", default=None, type=click.Choice(["1", "2"]), help="Only part")
+@click.option(
+    "--runs", default=10, help="Timed runs per part", type=click.IntRange(min=1)
+)
+@click.option(
+    "--warmup",
+    default=1,
+    help="Untimed warm-up runs per part",
+    type=click.IntRange(min=0),
+)
+@click.option("--jobs", default=1, help="Parts to benchmark concurrently", type=int)
+@click.option(
+    "--sizes",
+    default=None,
+    help="Benchmark synthetic inputs of these sizes instead, e.g. 100,1000,10000",
+)
+@click.option(
+    "--history",
+    default=None,
+    help="JSON history file to append results to",
+    type=click.Path(dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--compare",
+    default=None,
+    help="Baseline JSON to check for regressions against",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--threshold",
+    default=0.1,
+    help="Slowdown of the median that counts as a regression",
+    type=float,
+)
+def bench(
+    year: int | None,
+    day_range: str | None,
+    run_all: bool,
+    part: str | None,
+    runs: int,
+    warmup: int,
+    jobs: int,
+    sizes: str | None,
+    history: Path | None,
+    compare: Path | None,
+    threshold: float,
+) -> None:
+    from aoc.utils.bench import (
+        HISTORY_PATH,
+        BenchSettings,
+        append_history,
+        find_regressions,
+        load_baseline,
     )
-    result_text = response.content[0].text  # type: ignore
-    result_text = result_text.replace("```", "")
-    try:
-        claude_yaml = yaml_lead_in + result_text
-        yaml.safe_load(claude_yaml)
-        return claude_yaml
-    except yaml.YAMLError:
-        print("Warning: AI was unable to parse the question for the sample data")
-        return default_answer
+    from aoc.utils.generators import GENERATORS, scaling_exponent
+    from aoc.utils.runner import build_tasks, parse_day_range, run_tasks
+    from aoc.utils.table import format_table
+
+    if year is None and not run_all:
+        year = datetime.now(ZoneInfo("America/New_York")).year
+    input_sizes: list[int | None] = [None]
+    if sizes:
+        input_sizes = [int(x) for x in sizes.split(",")]
+    tasks = [
+        task
+        for task in build_tasks(
+            [year] if year else None,
+            parse_day_range(day_range) if day_range else None,
+        )
+        if (part is None or task.part == int(part))
+        and (not sizes or (task.year, task.day) in GENERATORS)
+    ]
+    if not tasks:
+        raise click.BadParameter("No solutions match the selected days")
+
+    print(f"🎄 Benchmarking {len(tasks)} parts ({warmup} warm-up, {runs} runs) 🎄")
+    results = []
+    for size in input_sizes:
+        for result in run_tasks(tasks, jobs, BenchSettings(runs, warmup, size)):
+            results.append(result)
+            label = f"{result.task}" + (f" (n={size})" if size else "")
+            if result.error:
+                print(f"{label}: {result.error}", flush=True)
+            else:
+                print(f"{label}: median {result.median:.4f}s", flush=True)
+    results.sort(key=lambda x: (x.task, x.size or 0))
+    timed = [r for r in results if not r.error]
+
+    print()
+    print(
+        format_table(
+            [
+                "Year",
+                "Day",
+                "Part",
+                "Size",
+                "Min (s)",
+                "Median (s)",
+                "p95 (s)",
+                "Stdev (s)",
+            ],
+            [
+                [
+                    r.task.year,
+                    r.task.day,
+                    r.task.part,
+                    r.size or "input",
+                    f"{r.min:.4f}",
+                    f"{r.median:.4f}",
+                    f"{r.p95:.4f}",
+                    f"{r.stdev:.4f}",
+                ]
+                for r in timed
+            ],
+        )
+    )
+    if sizes:
+        print("\nScaling (time ~ n^k):")
+        for task in tasks:
+            points = [r for r in timed if r.task == task]
+            exponent = scaling_exponent(
+                [r.size or 0 for r in points], [r.median for r in points]
+            )
+            if exponent is not None:
+                warning = " ⚠️  super-linear" if exponent > 1.2 else ""
+                print(f"{task}: k = {exponent:.2f}{warning}")
+
+    # Read before appending, as --compare may point at the history file itself
+    baseline = load_baseline(compare) if compare is not None else None
+    history = history or HISTORY_PATH
+    append_history(timed, history)
+    print(f"\nAppended results to {history}")
+
+    if baseline is not None:
+        regressions = find_regressions(timed, baseline, threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions over {threshold:.0%}:")
+            for result, change in regressions:
+                print(f"{result.task}: median {result.median:.4f}s (+{change:.0%})")
+            raise SystemExit(1)
+        print(f"\n✅ No regressions over {threshold:.0%} against {compare}")
 
 
 @cli.command()
-@click.option("--day", default=None, help="Day to run, defaults to latest", type=int)
-@click.option("--year", default=None, help="Year to run, defaults to latest", type=int)
-def solve(day: int | None, year: int | None = None) -> None:
-    now = datetime.now(ZoneInfo("America/New_York"))
-    year = year or now.year
-    days = get_days([year])
+def bundle() -> None:
+    from aoc.utils.bundle import BUNDLE_PATH, build_bundle
+
+    count = build_bundle()
+    size = BUNDLE_PATH.stat().st_size
+    print(f"📦 Bundled {count} files ({size / 1024:.0f} KiB) into {BUNDLE_PATH}")
+
 
+@cli.command()
+@click.option("--day", default=None, help="Day to watch, defaults to latest", type=int)
+@click.option(
+    "--year", default=None, help="Year to watch, defaults to latest", type=int
+)
+@click.option("--interval", default=0.5, help="Seconds between checks", type=float)
+def watch(day: int | None, year: int | None, interval: float) -> None:
+    from aoc.utils.watch import watch as watch_day
+
+    year = year or datetime.now(ZoneInfo("America/New_York")).year
     if day:
-        current_day = next((x for x in days if x.day_number == day), None)
+        current_day = get_day(year, day)
         if current_day is None:
             raise click.BadParameter(f"No solution yet for {day}")
     else:
-        current_day = days[-1]
-
-    print(f"🎄 Advent of Code {year}: Day {current_day.day_number} 🎄")
-    part1_answer = current_day.module.part1(current_day.solution_input)
-    print(f"Part 1:\n{part1_answer}\n\n")
-    if part1_answer is not None:
-        part2_answer = current_day.module.part2(current_day.solution_input)
-        print(f"Part 2:\n{part2_answer}")
+        current_day = get_days([year])[-1]
+    try:
+        watch_day(current_day.year, current_day.day_number, interval)
+    except KeyboardInterrupt:
+        pass
 
 
 @cli.command()
 @click.option("--day", default=None, help="Day to run, defaults to latest", type=int)
 @click.option("--year", default=None, help="Year to run, defaults to latest", type=int)
 def scaffold(day: int | None, year: int | None) -> None:
-    now = datetime.now(ZoneInfo("America/New_York"))
-    day = min(25, day or now.day)
-    year = year or now.year
-    session_cookie = os.getenv("ADVENT_SESSION_COOKIE", "")
-    session_file = Path.home() / ".adventofcode.session"
-    if not session_cookie and session_file.exists():
-        session_cookie = session_file.read_text()
-
-    if session_cookie:
-        cookies = {"session": session_cookie}
-        day_input = requests.get(
-            f"https://adventofcode.com/{year}/day/{day}/input",
-            cookies=cookies,
-        ).text
-    else:
-        day_input = ""
-        cookies = None
-
-    problem_html = requests.get(
-        f"https://adventofcode.com/{year}/day/{day}", cookies=cookies
-    ).text
-    problem_text = convert_to_plain_text(problem_html)
-    soup = BeautifulSoup(problem_html, "html.parser")
-    title_element = soup.find("h2")
-    puzzle_title = (
-        title_element.get_text().strip() if title_element else f"--- Day {day} ---"
-    )
-
-    project_dir = Path(__file__).resolve().parent
-    inputs_dir = project_dir.parent / "inputs" / str(year)
-    examples_dir = project_dir.parent / "examples" / str(year)
-    solutions_dir = project_dir / "solutions" / f"year{year}"
-    for directory in [inputs_dir, examples_dir, solutions_dir]:
-        if not directory.exists():
-            directory.mkdir(parents=True)
-    input_file = inputs_dir / f"{day:02d}.txt"
-    input_file.write_text(day_input)
-
-    # Generate example YAML and infer return types
-    example_yaml_text = get_test_yaml_from_problem(problem_text)
-    example_data = yaml.safe_load(example_yaml_text)
-    answers = example_data.get("answers", []) if example_data else []
-    part1_type = infer_return_type(answers[0] if len(answers) > 0 else None)
-    part2_type = infer_return_type(answers[1] if len(answers) > 1 else None)
-
-    solution_file = solutions_dir / f"day{day:02d}.py"
-    if not solution_file.exists():
-        solution_file.write_text(
-            textwrap.dedent(f"""\
-                # %%
-                \"\"\"
-                \"\"\"
-                from aoc.utils.helpers import example_input, example_answer
-
-                year = {year}
-                day = {day}
-
-                # Explore with example input
-                inp = example_input(year, day, part=1)
-                answer = example_answer(year, day, part=1)
-                print(f"Example input: {{inp[:100]}}...")
-                print(f"Expected answer: {{answer}}")
-
-                # %%
-                def part1(text: str) -> {part1_type} | None:
-                    return None
-
-
-                # %%
-                def part2(text: str) -> {part2_type} | None:
-                    return None
-                """)
-        )
-
-    with solution_file.open("r+") as f:
-        content = f.read()
-        start_index = content.find('"""')
-        end_index = content.find('"""', start_index + 3) + 3
-        if start_index != -1 and end_index != -1:
-            content = content[:start_index] + content[end_index:]
-        f.seek(0, 0)
-        f.write(f'"""\n{puzzle_title}\n"""\n' + content)
+    from aoc.utils.scaffold import scaffold_day
 
-    (examples_dir / f"{day:02d}.yaml").write_text(example_yaml_text)
+    now = datetime.now(ZoneInfo("America/New_York"))
+    scaffold_day(year or now.year, min(25, day or now.day))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from typing import Iterable, List
 
+from aoc.utils.inputs import as_lines
+
 
 def split_on_value(stream: Iterable[str], break_value: str = "") -> Iterable[List[int]]:
     buffer: List[int] = []
@@ -12,11 +14,11 @@ def split_on_value(stream: Iterable[str], break_value: str = "") -> Iterable[Lis
     yield buffer
 
 
-def part1(text: str) -> int | None:
-    return max([sum(x) for x in split_on_value(text.splitlines())])
+def part1(lines: Iterable[str]) -> int | None:
+    return max(sum(x) for x in split_on_value(as_lines(lines)))
 
 
-def part2(text: str) -> int | None:
+def part2(lines: Iterable[str]) -> int | None:
     return sum(
-        sorted([sum(x) for x in split_on_value(text.splitlines())], reverse=True)[:3]
+        sorted([sum(x) for x in split_on_value(as_lines(lines))], reverse=True)[:3]
     )
@@ -1,3 +1,7 @@
+from typing import Iterable
+
+from aoc.utils.inputs import as_lines
+
 SCORES = {-1: 0, 0: 3, 1: 6, 2: 0, -2: 6}
 VALUES = {"A": 1, "X": 1, "B": 2, "Y": 2, "C": 3, "Z": 3}
 THROW_ORDER = "ABC"
@@ -20,9 +24,9 @@ def choose_throw(line: str) -> str:
     raise Exception(f"Invalid second throw: {p2}")
 
 
-def part1(text: str) -> int | None:
-    return sum(score_round(x) for x in text.splitlines())
+def part1(lines: Iterable[str]) -> int | None:
+    return sum(score_round(x) for x in as_lines(lines))
 
 
-def part2(text: str) -> int | None:
-    return sum(score_round(choose_throw(x)) for x in text.splitlines())
+def part2(lines: Iterable[str]) -> int | None:
+    return sum(score_round(choose_throw(x)) for x in as_lines(lines))
@@ -2,6 +2,8 @@ from typing import TypeVar, Iterable
 
 from itertools import islice
 
+from aoc.utils.inputs import as_lines
+
 
 T = TypeVar("T")
 
@@ -28,9 +30,9 @@ def find_badge_priority(rucksacks: Iterable[str]) -> int:
     return priority(set.intersection(*[set(x) for x in rucksacks]).pop())
 
 
-def part1(text: str) -> int | None:
-    return sum(score_rucksack(x) for x in text.splitlines())
+def part1(lines: Iterable[str]) -> int | None:
+    return sum(score_rucksack(x) for x in as_lines(lines))
 
 
-def part2(text: str) -> int | None:
-    return sum(find_badge_priority(x) for x in chunks(text.splitlines(), 3))
+def part2(lines: Iterable[str]) -> int | None:
+    return sum(find_badge_priority(x) for x in chunks(as_lines(lines), 3))
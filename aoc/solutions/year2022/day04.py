@@ -1,5 +1,7 @@
 import re
-from typing import Tuple
+from typing import Iterable, Tuple
+
+from aoc.utils.inputs import as_lines
 
 
 LINE_RE = re.compile(r"(\d+)-(\d+),(\d+)-(\d+)")
@@ -24,9 +26,9 @@ def partially_overlap(x: Tuple[int, int], y: Tuple[int, int]) -> bool:
     return x_overlap_y(x, y) or x_overlap_y(y, x)
 
 
-def part1(text: str) -> int | None:
-    return sum(int(fully_overlap(*parse_line(x))) for x in text.splitlines())
+def part1(lines: Iterable[str]) -> int | None:
+    return sum(int(fully_overlap(*parse_line(x))) for x in as_lines(lines))
 
 
-def part2(text: str) -> int | None:
-    return sum(int(partially_overlap(*parse_line(x))) for x in text.splitlines())
+def part2(lines: Iterable[str]) -> int | None:
+    return sum(int(partially_overlap(*parse_line(x))) for x in as_lines(lines))
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, List
+
+from aoc.utils.inputs import as_lines
 
 
 TARGET_CYCLES = list(range(20, 221, 40))
@@ -7,7 +9,7 @@ TARGET_CYCLES = list(range(20, 221, 40))
 
 @dataclass
 class CPU:
-    instructions: List[str]
+    instructions: Iterable[str]
 
     def execute(self) -> List[int]:
         register_x = 1
@@ -33,12 +35,12 @@ class CPU:
         return result
 
 
-def part1(text: str) -> int | None:
-    cpu = CPU(text.splitlines())
+def part1(lines: Iterable[str]) -> int | None:
+    cpu = CPU(as_lines(lines))
     values = cpu.execute()
     return sum(values[x] * x for x in TARGET_CYCLES)
 
 
-def part2(text: str) -> str | None:
-    cpu = CPU(text.splitlines())
+def part2(lines: Iterable[str]) -> str | None:
+    cpu = CPU(as_lines(lines))
     return "\n".join(cpu.render())
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import List, Tuple
 
-from aoc.common.graph import astar
+from aoc.common.graph import astar, multi_astar_with_cost
+from aoc.common.priority_queue import BucketQueue
 
 
 @dataclass(frozen=True)
@@ -75,18 +76,13 @@ class HeightMap:
         def heuristic(p1: Point, p2: Point) -> int:
             return p1.manhattan_distance(p2)
 
-        candidate = []
         if all_minimums:
-            shortest = None
-            for minimum in self.minimums:
-                try:
-                    candidate = astar(minimum, self.end, heuristic, neighbors)
-                except Exception:
-                    pass
-                if shortest is None or len(candidate) < len(shortest):
-                    shortest = candidate
-            return shortest or []
-        return astar(self.start, self.end, heuristic, neighbors)
+            # One search from every lowest point at once
+            path, _ = multi_astar_with_cost(
+                self.minimums, [self.end], heuristic, neighbors, queue=BucketQueue
+            )
+            return path
+        return astar(self.start, self.end, heuristic, neighbors, queue=BucketQueue)
 
 
 def part1(text: str) -> int | None:
@@ -1,12 +1,13 @@
 import re
 from dataclasses import dataclass
 from functools import cache, cached_property
-from typing import Dict, Iterator, List, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Set, Tuple
 
 import immutables
 
+from aoc.common.branch_and_bound import branch_and_bound
 from aoc.common.graph import astar
-from aoc.common.priority_queue import PriorityQueue
+from aoc.common.search_stats import observe
 
 VALVE_RE = re.compile(
     r"Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? ([\w\,\s]+)"
@@ -97,11 +98,10 @@ class Volcano:
             0,
         )
 
-    def supercedes(self, other: "Volcano") -> bool:
-        return (
-            self.valves == other.valves
-            and sorted(self.locations) == sorted(other.locations)
-            and self.potential > other.potential
+    @cached_property
+    def opened(self) -> FrozenSet[str]:
+        return frozenset(
+            name for name, node in self.valves.items() if node.opened_at is not None
         )
 
     def egress(self, time: int, idx: int = 0) -> Iterator["Volcano"]:
@@ -143,8 +143,8 @@ class Volcano:
                 shortest_distance = min(
                     distances[(loc, valve_defn.name)] for loc in self.locations
                 )
-                unopened_value += valve_defn.flow_rate * (
-                    30 - (self.time + shortest_distance)
+                unopened_value += valve_defn.flow_rate * max(
+                    0, 30 - (self.time + shortest_distance)
                 )
         return self.value + unopened_value
 
@@ -156,31 +156,18 @@ class Volcano:
         )
 
 
-def solve(volvano: Volcano) -> int:
-    open_list: PriorityQueue[Volcano] = PriorityQueue()
-    open_list.push(volvano, volvano.potential)
-    best_paths: Dict[
-        Tuple[immutables.Map[str, ValveNode], Tuple[str, ...]], Volcano
-    ] = {}
-    culled = 0
-    explored = 0
-    while open_list:
-        next_node = open_list.pop()
-        explored += 1
-        if next_node.complete:
-            result = next_node.value
-            print(f"{culled=} {explored=}")
-            return result
-        for node in next_node.egress(next_node.time + 1):
-            best_key = (node.valves, node.locations)
-            if best_key not in best_paths or node.supercedes(best_paths[best_key]):
-                open_list.push(node, -1 * node.potential)
-                best_paths[best_key] = node
-            else:
-                culled += 1
-
-    print(f"{culled=}")
-    return max(x.value for x in best_paths.values() if x.complete)
+def solve(volcano: Volcano) -> int:
+    # The same valves open with the workers in the same places is no better
+    # when it's later or has released less pressure
+    return branch_and_bound(
+        volcano,
+        lambda v: () if v.complete else v.egress(v.time + 1),
+        lambda v: v.value,
+        lambda v: v.potential,
+        lambda v: (v.opened, tuple(sorted(v.locations))),
+        lambda v: (v.value, -v.time),
+        stats=observe(label="valves"),
+    ).value
 
 
 distances = None
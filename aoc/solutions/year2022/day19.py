@@ -1,15 +1,13 @@
-import bisect
-from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
 from functools import cache, cached_property
 import math
 import re
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import Iterable, Set, Tuple
 
 import immutables
 
-from aoc.common.priority_queue import PriorityQueue
+from aoc.common.branch_and_bound import branch_and_bound
 
 
 ROBOT_RE = re.compile(r"Each (\w+) robot costs ([\w\d\s]+).?")
@@ -102,18 +100,11 @@ class State:
     robots: immutables.Map[Resource, int]
     blueprint: Blueprint
 
-    def __lt__(self, other: "State") -> bool:
-        return (self.resource_count + self.robot_count) < (
-            other.resource_count + other.robot_count
-        )
-
-    @cached_property
-    def resource_count(self) -> int:
-        return sum(self.resources.values())
-
     @cached_property
-    def robot_count(self) -> int:
-        return sum(self.robots.values())
+    def inventory(self) -> Tuple[int, ...]:
+        return tuple(self.robots.get(r, 0) for r in reversed(Resource)) + tuple(
+            self.resources.get(r, 0) for r in reversed(Resource)
+        )
 
     @cached_property
     def _hash(self) -> int:
@@ -167,48 +158,18 @@ class State:
 
 
 def blueprint_quality(blueprint: Blueprint, time: int) -> int:
-    closed: Set[State] = set()
-    open: PriorityQueue[State] = PriorityQueue()
     initial_state = State(
         time, immutables.Map(), immutables.Map([(Resource.ORE, 1)]), blueprint
     )
-    open.push(initial_state, -initial_state.potential[0])
-    finished = set()
-    geode_count = 0
-    priority_map: Dict[Tuple[int, int], List[State]] = defaultdict(list)
-    while open:
-        next_state = open.pop()
-        for child in next_state.progress():
-            if child not in closed and child not in open:
-                potential, new_geod_bots = child.potential
-                finished_key = (
-                    child.robots.get(Resource.GEODE, 0),
-                    child.resources.get(Resource.GEODE, 0),
-                    child.time_remaining,
-                )
-                if new_geod_bots == 0:
-                    if finished_key in finished:
-                        continue
-                    finished.add(finished_key)
-                geode_count = max(
-                    geode_count, child.existing_total_for_resource(Resource.GEODE)
-                )
-
-                if potential >= geode_count:
-                    same_priorities = priority_map[(potential, child.time_remaining)]
-                    idx = bisect.bisect_left(same_priorities, child)
-                    for prior_state in same_priorities[idx:]:
-                        if diff_maps(prior_state.robots, child.robots) and diff_maps(
-                            prior_state.resources, child.resources
-                        ):
-                            break
-                    else:
-                        open.push(child, -potential)
-                        bisect.insort(same_priorities, child)
-        if next_state.time_remaining == 0:
-            return geode_count
-        closed.add(next_state)
-    return geode_count
+    # At the same time, fewer robots and fewer resources is never better
+    return branch_and_bound(
+        initial_state,
+        State.progress,
+        lambda s: s.existing_total_for_resource(Resource.GEODE),
+        lambda s: s.potential[0],
+        lambda s: s.time_remaining,
+        lambda s: s.inventory,
+    ).value
 
 
 def part1(text: str) -> int | None:
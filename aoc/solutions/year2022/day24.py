@@ -8,6 +8,7 @@ import immutables
 
 from aoc.common.graph import astar_optimizable
 from aoc.common.point import Point
+from aoc.common.priority_queue import BucketQueue
 
 
 class Direction(Enum):
@@ -164,25 +165,25 @@ class State:
 
 def part1(text: str) -> int | None:
     m = State.parse(text)
-    path: List[State] = astar_optimizable(m)[0]
+    path: List[State] = astar_optimizable(m, queue=BucketQueue)[0]
     return len(path) - 1
 
 
 def part2(text: str) -> int | None:
     m = State.parse(text)
-    path: List[State] = astar_optimizable(m)[0]  # type: ignore
+    path: List[State] = astar_optimizable(m, queue=BucketQueue)[0]  # type: ignore
     first_half = len(path) - 1
     m = State(
         path[-1].blizzards,
         path[-1].position,
         Maze(m.maze.end, m.maze.start, m.maze.top_left, m.maze.bottom_right),
     )
-    path = astar_optimizable(m)[0]
+    path = astar_optimizable(m, queue=BucketQueue)[0]
     go_back = len(path) - 1
     m = State(
         path[-1].blizzards,
         path[-1].position,
         Maze(m.maze.end, m.maze.start, m.maze.top_left, m.maze.bottom_right),
     )
-    path = astar_optimizable(m)[0]
+    path = astar_optimizable(m, queue=BucketQueue)[0]
     return first_half + go_back + len(path) - 1
@@ -1,4 +1,7 @@
 import math
+from typing import Iterable
+
+from aoc.utils.inputs import as_lines
 
 
 DECODER = {"=": -2, "-": -1, "0": 0, "1": 1, "2": 2}
@@ -29,9 +32,9 @@ def dec_to_snafu(value: int) -> str:
     return "".join(result).lstrip("0")
 
 
-def part1(text: str) -> str | None:
-    return dec_to_snafu(sum(snafu_to_dec(x) for x in text.splitlines()))
+def part1(lines: Iterable[str]) -> str | None:
+    return dec_to_snafu(sum(snafu_to_dec(x) for x in as_lines(lines)))
 
 
-def part2(text: str) -> str | None:
+def part2(lines: Iterable[str]) -> str | None:
     return None
@@ -1,3 +1,7 @@
+from typing import Iterable
+
+from aoc.utils.inputs import as_lines
+
 DIGIT_STRINGS = {
     "one": 1,
     "two": 2,
@@ -11,8 +15,8 @@ DIGIT_STRINGS = {
 }
 
 
-def to_digits(text: str) -> list[list[int]]:
-    return [[int(c) for c in line if c.isnumeric()] for line in text.splitlines()]
+def to_digits(lines: Iterable[str]) -> Iterable[list[int]]:
+    return ([int(c) for c in line if c.isnumeric()] for line in lines)
 
 
 def text_to_digit(text: str) -> str:
@@ -21,9 +25,9 @@ def text_to_digit(text: str) -> str:
     return text
 
 
-def part1(text: str) -> str | None:
-    return str(sum(10 * x[0] + x[-1] for x in to_digits(text)))
+def part1(lines: Iterable[str]) -> str | None:
+    return str(sum(10 * x[0] + x[-1] for x in to_digits(as_lines(lines))))
 
 
-def part2(text: str) -> str | None:
-    return part1(text_to_digit(text))
+def part2(lines: Iterable[str]) -> str | None:
+    return part1(text_to_digit(line) for line in as_lines(lines))
@@ -2,6 +2,9 @@ from collections import defaultdict
 from dataclasses import dataclass
 from functools import reduce
 import re
+from typing import Iterable, List
+
+from aoc.utils.inputs import as_lines
 
 
 LIMITS = {
@@ -51,18 +54,18 @@ class CubeGame:
 
 @dataclass
 class Day02:
-    games: list[CubeGame]
+    games: List[CubeGame]
 
     @classmethod
-    def parse(cls, text: str) -> "Day02":
-        return cls([CubeGame.parse(g.strip()) for g in text.splitlines()])
+    def parse(cls, lines: Iterable[str]) -> "Day02":
+        return cls([CubeGame.parse(g.strip()) for g in as_lines(lines)])
 
 
-def part1(text: str) -> int | None:
-    games = Day02.parse(text)
+def part1(lines: Iterable[str]) -> int | None:
+    games = Day02.parse(lines)
     return sum(g.num for g in games.games if g.is_valid())
 
 
-def part2(text: str) -> int | None:
-    games = Day02.parse(text)
+def part2(lines: Iterable[str]) -> int | None:
+    games = Day02.parse(lines)
     return sum(g.powerset() for g in games.games)
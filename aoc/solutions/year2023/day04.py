@@ -1,5 +1,9 @@
 from dataclasses import dataclass
 import re
+from collections import defaultdict
+from typing import Iterable
+
+from aoc.utils.inputs import as_lines
 
 
 CARD_RE = re.compile(r"Card\s+(\d+):\s+([\d\s]+)\|\s+([\d\s]+)")
@@ -33,15 +37,14 @@ class Card:
             raise ValueError(f"Invalid card: {text}")
 
 
-def part1(text: str) -> int | None:
-    return sum(Card.parse(card).score for card in text.splitlines())
+def part1(lines: Iterable[str]) -> int | None:
+    return sum(Card.parse(card).score for card in as_lines(lines))
 
 
-def part2(text: str) -> int | None:
-    cards = [Card.parse(card) for card in text.splitlines()]
-    counts: dict[int, int] = {card.number: 1 for card in cards}
-    for card in cards:
-        matches = card.matches
-        for next_card in range(card.number + 1, card.number + 1 + matches):
-            counts[next_card] += counts[card.number]
+def part2(lines: Iterable[str]) -> int | None:
+    counts: dict[int, int] = defaultdict(lambda: 1)
+    for card in (Card.parse(line) for line in as_lines(lines)):
+        copies = counts[card.number]
+        for next_card in range(card.number + 1, card.number + 1 + card.matches):
+            counts[next_card] += copies
     return sum(counts.values())
@@ -122,21 +122,27 @@ Once again consider your left and right lists. What is their similarity score?
 """
 
 from collections import Counter
+from typing import Iterable
 
+from aoc.utils.inputs import as_lines
 
-def parse_input(text: str):
-    parsed_lines = [
-        (int(a), int(b)) for a, b in (line.split() for line in text.splitlines())
-    ]
-    return list(zip(*parsed_lines))
 
+def parse_input(lines: Iterable[str]) -> tuple[list[int], list[int]]:
+    a: list[int] = []
+    b: list[int] = []
+    for line in as_lines(lines):
+        lhs, rhs = line.split()
+        a.append(int(lhs))
+        b.append(int(rhs))
+    return a, b
 
-def part1(text: str) -> int | None:
-    a, b = parse_input(text)
+
+def part1(lines: Iterable[str]) -> int | None:
+    a, b = parse_input(lines)
     return sum(abs(x - y) for x, y in zip(sorted(a), sorted(b)))
 
 
-def part2(text: str) -> int | None:
-    a, b = parse_input(text)
+def part2(lines: Iterable[str]) -> int | None:
+    a, b = parse_input(lines)
     b_count = Counter(b)
     return sum(x * b_count[x] for x in a)
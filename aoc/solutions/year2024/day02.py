@@ -78,6 +78,10 @@ Update your analysis by handling situations where the Problem Dampener can
 remove a single level from unsafe reports. How many reports are now safe?
 """
 
+from typing import Iterable
+
+from aoc.utils.inputs import as_lines
+
 
 def is_safe(level: list[int]) -> bool:
     for i, x in enumerate(level[1:], 1):
@@ -89,15 +93,13 @@ def is_safe(level: list[int]) -> bool:
     return True
 
 
-def part1(text: str) -> int | None:
-    return sum(
-        int(is_safe([int(x) for x in line.split()])) for line in text.splitlines()
-    )
+def part1(lines: Iterable[str]) -> int | None:
+    return sum(int(is_safe([int(x) for x in line.split()])) for line in as_lines(lines))
 
 
-def part2(text: str) -> int | None:
+def part2(lines: Iterable[str]) -> int | None:
     total = 0
-    for line in text.splitlines():
+    for line in as_lines(lines):
         parsed_line = [int(x) for x in line.split()]
         if is_safe(parsed_line):
             total += 1
@@ -60,27 +60,28 @@ just the enabled multiplications?
 """
 
 import re
+from collections.abc import Buffer
 
-MUL_REGEX = re.compile(r"mul\((\d{1,3}),(\d{1,4})\)")
-DO_DONT_REGEX = re.compile(r"(do\(\)|don't\(\))")
+MUL_REGEX = re.compile(rb"mul\((\d{1,3}),(\d{1,4})\)")
+DO_DONT_REGEX = re.compile(rb"(do\(\)|don't\(\))")
 
 
-def part1(text: str) -> int | None:
+def part1(data: Buffer) -> int | None:
     total = 0
-    for match in MUL_REGEX.finditer(text):
+    for match in MUL_REGEX.finditer(data):
         lhs, rhs = (int(x) for x in match.groups())
         total += lhs * rhs
     return total
 
 
-def part2(text: str) -> int | None:
+def part2(data: Buffer) -> int | None:
     total = 0
-    do_dont_matches = list(DO_DONT_REGEX.finditer(text))
+    do_dont_matches = list(DO_DONT_REGEX.finditer(data))
     accum = True
-    for match in MUL_REGEX.finditer(text):
+    for match in MUL_REGEX.finditer(data):
         while do_dont_matches and match.span()[0] > do_dont_matches[0].span()[0]:
             next_match = do_dont_matches.pop(0)
-            accum = next_match.group(1) == "do()"
+            accum = next_match.group(1) == b"do()"
         if accum:
             lhs, rhs = (int(x) for x in match.groups())
             total += lhs * rhs
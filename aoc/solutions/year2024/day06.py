@@ -331,9 +331,13 @@ class Maze:
         return len(new_blocks - self.blocks)
 
 
-def part1(text: str) -> int | None:
-    return Maze.parse(text).count_steps()
+def parse(text: str) -> Maze:
+    return Maze.parse(text)
 
 
-def part2(text: str) -> int | None:
-    return Maze.parse(text).count_blocks()
+def part1(maze: Maze) -> int | None:
+    return maze.count_steps()
+
+
+def part2(maze: Maze) -> int | None:
+    return maze.count_blocks()
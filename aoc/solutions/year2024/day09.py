@@ -109,7 +109,7 @@ import itertools
 from collections import defaultdict
 
 
-def parse(text):
+def parse_disk_map(text):
     memory = []
     total_free = 0
     free_list = defaultdict(list)
@@ -129,7 +129,7 @@ def parse(text):
 
 
 def part1(text: str) -> int | None:
-    memory, total_free, _ = parse(text)
+    memory, total_free, _ = parse_disk_map(text)
     unifed_memory = list(itertools.chain.from_iterable(memory))
     front = 0
     back = len(unifed_memory) - 1
@@ -150,7 +150,7 @@ def part1(text: str) -> int | None:
 
 
 def part2(text: str) -> int | None:
-    memory, _, free_list = parse(text)
+    memory, _, free_list = parse_disk_map(text)
     for back in range(len(memory) - 1, 0, -1):
         chunk = memory[back]
         if not chunk:
@@ -191,11 +191,11 @@ Adding these together produces its new total price of 1206.
 What is the new total price of fencing all regions on your map?
 """
 
-from aoc.common.grid import Grid
+from aoc.common.grid import DenseGrid
 from aoc.common.point import Point
 
 
-class Garden(Grid[str]):
+class Garden(DenseGrid[str]):
     def flood_full(self, point: Point, current_region: set[Point]):
         if point in current_region:
             return
@@ -465,9 +465,9 @@ is the sum of all boxes' final GPS coordinates?
 from copy import copy
 from enum import Enum
 
-from immutables import Map, MapMutation
+from immutables import Map
 
-from aoc.common.grid import Grid
+from aoc.common.grid import DenseGrid, GridMutation
 from aoc.common.point import CHAR_TO_DIRECTION, Point
 
 
@@ -483,7 +483,7 @@ class CellType(Enum):
 BOX_TO_PAIR = {CellType.LEFT_BOX: Point(1, 0), CellType.RIGHT_BOX: Point(-1, 0)}
 
 
-class Warehouse(Grid[CellType]):
+class Warehouse(DenseGrid[CellType]):
     @property
     def fish(self):
         return next(
@@ -505,7 +505,7 @@ class Warehouse(Grid[CellType]):
         return tuple(sorted((box, box + BOX_TO_PAIR[self.entries[box]])))  # type: ignore
 
     def push_double_box(
-        self, box: Point, direction: Point, result: MapMutation[Point, CellType]
+        self, box: Point, direction: Point, result: GridMutation[CellType]
     ):
         boxes: set[tuple[Point, Point]] = set([self.box_pair(box)])
         frontier_queue = copy(boxes)
@@ -584,17 +584,23 @@ class Warehouse(Grid[CellType]):
         return Warehouse(next_entries, self.lower_right_bound)
 
 
-def part1(text: str) -> int | None:
+def parse(text: str) -> tuple[Warehouse, str]:
     warehouse_text, steps = text.split("\n\n")
-    warehouse = Warehouse.parse(warehouse_text, CellType)
-    for step in "".join(steps.splitlines()).strip():
+    return Warehouse.parse(warehouse_text, CellType), "".join(
+        steps.splitlines()
+    ).strip()
+
+
+def part1(puzzle: tuple[Warehouse, str]) -> int | None:
+    warehouse, steps = puzzle
+    for step in steps:
         warehouse = warehouse.next(step)
     return warehouse.value
 
 
-def part2(text: str) -> int | None:
-    warehouse_text, steps = text.split("\n\n")
-    warehouse = Warehouse.parse(warehouse_text, CellType).double()
-    for step in "".join(steps.splitlines()).strip():
+def part2(puzzle: tuple[Warehouse, str]) -> int | None:
+    warehouse, steps = puzzle
+    warehouse = warehouse.double()
+    for step in steps:
         warehouse = warehouse.next(step)
     return warehouse.value
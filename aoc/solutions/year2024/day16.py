@@ -159,10 +159,10 @@ paths through the maze?
 
 from dataclasses import dataclass
 
-from aoc.common.graph import astar_with_cost
-from aoc.common.grid import Grid
+from aoc.common.graph import astar_with_cost, djikstra_dag
+from aoc.common.grid import DenseGrid
 from aoc.common.point import Point
-from aoc.common.priority_queue import PriorityQueue
+from aoc.common.priority_queue import RadixHeap
 
 EAST = Point(1, 0)
 
@@ -187,7 +187,7 @@ class Goal(Reindeer):
         return hash(self.loc)
 
 
-class Maze(Grid[str]):
+class Maze(DenseGrid[str]):
     def neighbors(self, reindeer: Reindeer):
         result: list[tuple[Reindeer, int]] = []
         turn_penalty = 1000
@@ -228,46 +228,21 @@ class Maze(Grid[str]):
         start = [key for key, value in self.entries.items() if value == "S"][0]
         end = [key for key, value in self.entries.items() if value == "E"][0]
 
-        path, best_cost = astar_with_cost(
-            Reindeer(start, EAST), Goal(end, EAST), self.heuristic, self.neighbors
+        directions = [EAST, EAST.rotate_left(), -EAST, EAST.rotate_right()]
+        ends = [Reindeer(end, direction) for direction in directions]
+        paths = djikstra_dag(
+            Reindeer(start, EAST), self.neighbors, targets=ends, queue=RadixHeap
         )
-        in_best = set()
-        frontier: PriorityQueue[Reindeer] = PriorityQueue()
-        frontier.push(path[0], 0)
-        solved_costs = {path[0]: best_cost}
-        for current, last in zip(path[1:], path):
-            solved_costs[current] = solved_costs[last] - self.heuristic(current, last)
-
-        while frontier:
-            node, cost_to_node = frontier.pop_with_priorty()
-            for neighbor, cost in self.neighbors(node):
-                if neighbor in solved_costs:
-                    cost_to_end = solved_costs[neighbor]
-                    my_path = None
-                else:
-                    try:
-                        my_path, cost_to_end = astar_with_cost(
-                            neighbor, Goal(end, EAST), self.heuristic, self.neighbors
-                        )
-                    except Exception:
-                        continue
-                total_cost = cost_to_end + cost_to_node + cost
-                if total_cost == best_cost:
-                    if my_path:
-                        for current, last in zip(path[1:], path):
-                            solved_costs[current] = solved_costs[last] - self.heuristic(
-                                current, last
-                            )
-                    if neighbor not in in_best:
-                        frontier.push(neighbor, cost_to_node + cost)
-
-            in_best.add(node)
-        return len({r.loc for r in in_best})
-
-
-def part1(text: str) -> int | None:
-    return Maze.parse(text, str).solve()
-
-
-def part2(text: str) -> int | None:
-    return Maze.parse(text, str).all_paths()
+        return len({r.loc for r in paths.nodes_on_paths(ends)})
+
+
+def parse(text: str) -> Maze:
+    return Maze.parse(text, str)
+
+
+def part1(maze: Maze) -> int | None:
+    return maze.solve()
+
+
+def part2(maze: Maze) -> int | None:
+    return maze.all_paths()
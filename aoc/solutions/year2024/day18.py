@@ -127,7 +127,7 @@ separated by a comma with no other characters.)
 # %%
 from dataclasses import dataclass
 
-from aoc.common.graph import astar
+from aoc.common.graph import IndexedGraph
 from aoc.common.point import Point
 
 
@@ -161,7 +161,7 @@ class Memory:
 
         return (
             len(
-                astar(
+                IndexedGraph.grid(self.lower_right_bound).astar(
                     Point(0, 0),
                     Point(self.lower_right_bound.x - 1, self.lower_right_bound.y - 1),
                     heuristic,
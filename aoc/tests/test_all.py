@@ -1,11 +1,21 @@
 import os
+import time
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List
+
+import pytest
 
 from aoc.utils.finder import Day, get_days
+from aoc.utils.runner import Task, TaskResult, run_tasks
+from aoc.utils.sandbox import Limits, run_sandboxed
 
 
-def pytest_generate_tests(metafunc: Any) -> None:
+def selected_days() -> List[Day]:
+    """Days to test, from the filenames alone so no solution is imported.
+
+    ``ADVENT_TEST_SHARD=i/n`` keeps every n-th day starting from the i-th, so
+    n pytest processes (or CI jobs) can split the catalog between them.
+    """
     # Add the current year to years from datetime
     current_year = datetime.now().year
     if datetime.now().month < 12:
@@ -14,10 +24,89 @@ def pytest_generate_tests(metafunc: Any) -> None:
     if os.getenv("ADVENT_RUN_ALL_TESTS", "").lower() == "true":
         years = None
     days = get_days(years)
+    shard = os.getenv("ADVENT_TEST_SHARD")
+    if shard:
+        index, count = map(int, shard.split("/"))
+        days = days[index - 1 :: count]
+    return days
+
+
+def pytest_generate_tests(metafunc: Any) -> None:
+    days = selected_days()
     metafunc.parametrize("day", [d for d in days], ids=[str(d) for d in days])
 
 
-def test_day(day: Day) -> None:
-    for part, answer in enumerate(day.example_answers):
-        example_input = day.example_input_for_part(part)
-        assert str(getattr(day.module, f"part{part + 1}")(example_input)) == answer
+def sandbox_limits() -> Limits:
+    """Limits from ``ADVENT_TEST_TIMEOUT`` (seconds) and ``ADVENT_TEST_MAX_MEMORY``
+    (MB). When either is set every part runs in its own limited child process.
+    """
+    timeout = os.getenv("ADVENT_TEST_TIMEOUT")
+    max_memory = os.getenv("ADVENT_TEST_MAX_MEMORY")
+    return Limits(
+        float(timeout) if timeout else None,
+        int(max_memory) * 1024 * 1024 if max_memory else None,
+    )
+
+
+@pytest.fixture(scope="session")
+def example_results(request: Any) -> Dict[Task, TaskResult]:
+    """With ``ADVENT_TEST_JOBS=N``, solve every collected day's examples up
+    front across N worker processes. Otherwise each test solves its own.
+    """
+    jobs = os.getenv("ADVENT_TEST_JOBS")
+    if not jobs:
+        return {}
+    days = [
+        item.callspec.params["day"]
+        for item in request.session.items
+        if hasattr(item, "callspec") and "day" in item.callspec.params
+    ]
+    tasks = [
+        Task(day.year, day.day_number, part, example=True)
+        for day in days
+        for part in range(1, len(day.example_answers) + 1)
+    ]
+    limits = sandbox_limits()
+    if limits:
+        results = run_sandboxed(tasks, int(jobs), limits)
+    else:
+        results = run_tasks(tasks, int(jobs))
+    return {result.task: result for result in results}
+
+
+def test_day(day: Day, example_results: Dict[Task, TaskResult]) -> None:
+    limits = sandbox_limits()
+    elapsed = 0.0
+    for part, answer in enumerate(day.example_answers, 1):
+        task = Task(day.year, day.day_number, part, example=True)
+        if task in example_results:
+            result = example_results[task]
+        elif limits:
+            result = next(run_sandboxed([task], 1, limits))
+        else:
+            example_input = day.adapt_text(part, day.example_input_for_part(part - 1))
+            start = time.perf_counter()
+            parsed = day.parse_input(example_input)
+            result = TaskResult(
+                task, str(day.solve_part(part, parsed)), time.perf_counter() - start
+            )
+        assert result.error is None, result.error
+        assert str(result.answer) == answer
+        elapsed += result.wall_time
+    if day.example_budget is not None:
+        assert elapsed <= day.example_budget, (
+            f"examples took {elapsed:.2f}s, over the {day.example_budget:g}s budget"
+        )
+
+
+def test_shared_parse(day: Day) -> None:
+    """Both parts get the one ``parse()`` result, as ``aoc solve`` hands them,
+    so neither may change it under the other.
+    """
+    if not day.has_parse_hook or isinstance(day.example_input, list):
+        pytest.skip("parts don't share a parsed example")
+    parsed = day.parse_input(day.adapt_text(1, day.example_input_for_part(0)))
+    parts = list(enumerate(day.example_answers, 1))
+    # Part 1 again last, so a part 2 that mutates is caught too
+    for part, answer in parts + parts[:1]:
+        assert str(day.solve_part(part, parsed)) == answer, f"part {part}"
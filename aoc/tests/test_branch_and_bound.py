@@ -0,0 +1,63 @@
+from itertools import combinations
+from typing import Iterator, Tuple
+
+from aoc.common.branch_and_bound import ParetoFront, branch_and_bound
+from aoc.common.search_stats import SearchStats
+
+ITEMS = [(12, 4), (10, 6), (8, 5), (11, 7), (14, 3), (7, 1), (9, 6)]
+CAPACITY = 15
+
+# Items considered so far, weight used and value packed
+Knapsack = Tuple[int, int, int]
+
+
+def test_pareto_front() -> None:
+    front = ParetoFront()
+    assert front.add((1, 5))
+    assert front.add((3, 3))
+    assert not front.add((1, 4))
+    assert not front.add((3, 3))
+    assert front.add((5, 1))
+    assert len(front) == 3
+    # Dominates both (1, 5) and (3, 3)
+    assert front.add((3, 6))
+    assert front.vectors == [(3, 6), (5, 1)]
+    assert front.dominated((2, 2))
+    assert not front.dominated((6, 0))
+
+
+def test_branch_and_bound_knapsack() -> None:
+    def successors(state: Knapsack) -> Iterator[Knapsack]:
+        index, weight, value = state
+        if index == len(ITEMS):
+            return
+        yield index + 1, weight, value
+        item_value, item_weight = ITEMS[index]
+        if weight + item_weight <= CAPACITY:
+            yield index + 1, weight + item_weight, value + item_value
+
+    def upper_bound(state: Knapsack) -> int:
+        index, _, value = state
+        return value + sum(v for v, _ in ITEMS[index:])
+
+    stats = SearchStats()
+    result = branch_and_bound(
+        (0, 0, 0),
+        successors,
+        lambda s: s[2],
+        upper_bound,
+        lambda s: s[0],
+        # Less weight used and more value packed is never worse
+        lambda s: (-s[1], s[2]),
+        stats=stats,
+    )
+    expected = max(
+        sum(v for v, _ in chosen)
+        for n in range(len(ITEMS) + 1)
+        for chosen in combinations(ITEMS, n)
+        if sum(w for _, w in chosen) <= CAPACITY
+    )
+    assert result.value == expected
+    assert result.stats is stats
+    assert stats.pruned > 0
+    assert stats.expanded < 2 ** len(ITEMS)
@@ -0,0 +1,49 @@
+import os
+from pathlib import Path
+
+from aoc.utils.bundle import Bundle, build_bundle
+
+
+def write_sources(root: Path) -> None:
+    (root / "examples" / "2024").mkdir(parents=True)
+    (root / "inputs" / "2024").mkdir(parents=True)
+    (root / "examples" / "2024" / "01.yaml").write_text(
+        "input: |-\n  1 2\n  3 4\nanswers:\n  - 10\n  - '20'\n"
+    )
+    (root / "inputs" / "2024" / "01.txt").write_text("5 6\n7 8\n")
+
+
+def test_bundle_round_trip(tmp_path: Path) -> None:
+    write_sources(tmp_path)
+    assert build_bundle(tmp_path / "bundle.bin", tmp_path) == 2
+    bundle = Bundle.open(tmp_path / "bundle.bin", tmp_path)
+    assert bundle is not None
+    example = bundle.example(tmp_path / "examples" / "2024" / "01.yaml")
+    assert example == {"input": "1 2\n3 4", "answers": [10, "20"]}
+    data = bundle.get(tmp_path / "inputs" / "2024" / "01.txt")
+    assert data is not None and bytes(data) == b"5 6\n7 8\n"
+    assert bundle.get(tmp_path / "inputs" / "2024" / "02.txt") is None
+
+
+def test_bundle_invalidation(tmp_path: Path) -> None:
+    write_sources(tmp_path)
+    build_bundle(tmp_path / "bundle.bin", tmp_path)
+    bundle = Bundle.open(tmp_path / "bundle.bin", tmp_path)
+    assert bundle is not None
+    input_path = tmp_path / "inputs" / "2024" / "01.txt"
+
+    # Touched without changing: still served, via the content hash
+    stat = input_path.stat()
+    os.utime(input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert bundle.get(input_path) is not None
+
+    input_path.write_text("5 6\n7 9\n")
+    assert bundle.get(input_path) is None
+    input_path.unlink()
+    assert bundle.get(input_path) is None
+
+
+def test_missing_bundle(tmp_path: Path) -> None:
+    assert Bundle.open(tmp_path / "bundle.bin", tmp_path) is None
+    (tmp_path / "bundle.bin").write_bytes(b"not a bundle")
+    assert Bundle.open(tmp_path / "bundle.bin", tmp_path) is None
@@ -0,0 +1,32 @@
+import os
+from pathlib import Path
+
+from aoc.utils.cache import ENTRY_SUFFIX, AnswerCache
+
+
+def test_evict_only_removes_answers(tmp_path: Path) -> None:
+    history = tmp_path / "bench_history.json"
+    history.write_text("[]" + " " * 1000)
+    bundle = tmp_path / "bundle.bin"
+    bundle.write_bytes(b"\0" * 1000)
+    answers = []
+    for i in range(4):
+        answer = tmp_path / f"{i}{ENTRY_SUFFIX}"
+        answer.write_text('{"answer": "1", "wall_time": 0.0}')
+        os.utime(answer, ns=(i * 10**9, i * 10**9))
+        answers.append(answer)
+    size = answers[0].stat().st_size
+
+    AnswerCache(tmp_path, max_bytes=2 * size).evict()
+
+    assert [answer.exists() for answer in answers] == [False, False, True, True]
+    assert history.exists() and bundle.exists()
+
+
+def test_evict_migrates_legacy_entries(tmp_path: Path) -> None:
+    key = "ab" * 32
+    (tmp_path / f"{key}.json").write_text('{"answer": "1", "wall_time": 0.0}')
+
+    AnswerCache(tmp_path).evict()
+
+    assert [p.name for p in tmp_path.iterdir()] == [f"{key}{ENTRY_SUFFIX}"]
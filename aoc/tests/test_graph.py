@@ -1,8 +1,33 @@
-from typing import Iterable, Tuple
+import json
+from typing import Any, Callable, Iterable, Tuple
 
+import pytest
 from immutables import Map
 
-from aoc.common.graph import astar, djikstra
+from aoc.common.graph import (
+    IndexedGraph,
+    OptimizeWrapper,
+    astar,
+    astar_search,
+    astar_with_cost,
+    beam_search,
+    bidirectional_astar_with_cost,
+    djikstra,
+    djikstra_dag,
+    ida_star,
+    memory_bounded_astar,
+    multi_astar_with_cost,
+    multi_source_djikstra,
+    reverse_graph,
+)
+from aoc.common.point import Point
+from aoc.common.priority_queue import (
+    BucketQueue,
+    IndexedPriorityQueue,
+    Queue,
+    RadixHeap,
+)
+from aoc.common.search_stats import SearchStats, collect_search_stats
 
 
 def test_astar() -> None:
@@ -50,3 +75,237 @@ def test_djikstra() -> None:
             "f": 3,
         }
     )
+
+
+def grid_neighbors(walls: set[Tuple[int, int]], size: int):
+    def neighbors(p: Tuple[int, int]) -> Iterable[Tuple[Tuple[int, int], int]]:
+        x, y = p
+        for nx, ny in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+            if 0 <= nx < size and 0 <= ny < size and (nx, ny) not in walls:
+                yield (nx, ny), 1 + (nx * 7 + ny * 3) % 4
+
+    return neighbors
+
+
+def manhattan(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def test_multi_source_djikstra() -> None:
+    neighbors = grid_neighbors({(1, 0), (1, 1)}, 4)
+    starts = [(0, 0), (3, 3)]
+    combined = multi_source_djikstra(starts, neighbors)
+    separate = [djikstra(start, neighbors) for start in starts]
+    assert combined == Map(
+        {node: min(costs[node] for costs in separate) for node in combined}
+    )
+    partial = multi_source_djikstra(starts, neighbors, targets=[(0, 1)])
+    assert partial[(0, 1)] == combined[(0, 1)]
+    assert len(partial) < len(combined)
+
+    # A repeated start is queued once, and "b" is improved while queued
+    edges = {"a": [("b", 5), ("c", 1)], "c": [("b", 1)]}
+    stats = SearchStats()
+    multi_source_djikstra(["a", "a"], lambda n: edges.get(n, []), stats=stats)
+    assert (stats.pushes, stats.decrease_keys, stats.peak_open) == (4, 1, 2)
+
+
+def test_multi_astar_with_cost() -> None:
+    neighbors = grid_neighbors({(2, y) for y in range(7)}, 8)
+    starts = [(0, 0), (0, 7), (5, 5)]
+    ends = [(7, 0), (3, 3)]
+    path, cost = multi_astar_with_cost(starts, ends, manhattan, neighbors)
+    expected = min(djikstra(start, neighbors)[end] for start in starts for end in ends)
+    assert cost == expected
+    assert path[0] in starts and path[-1] in ends
+    assert sum(dict(neighbors(a))[b] for a, b in zip(path, path[1:])) == cost
+
+
+def test_bidirectional_astar_with_cost() -> None:
+    walls = {(3, y) for y in range(8)} | {(6, y) for y in range(2, 10)}
+    neighbors = grid_neighbors(walls, 10)
+    costs = djikstra((0, 0), neighbors)
+    for end in [(9, 9), (9, 0), (0, 0), (5, 5)]:
+        path, cost = bidirectional_astar_with_cost((0, 0), end, manhattan, neighbors)
+        assert cost == costs[end]
+        assert path[0] == (0, 0) and path[-1] == end
+        assert sum(dict(neighbors(a))[b] for a, b in zip(path, path[1:])) == cost
+
+
+def test_reverse_graph() -> None:
+    neighbors = grid_neighbors(set(), 5)
+    to_corner = multi_source_djikstra([(4, 4)], reverse_graph([(0, 0)], neighbors))
+    for start in [(0, 0), (2, 3), (4, 0)]:
+        assert to_corner[start] == djikstra(start, neighbors)[(4, 4)]
+
+
+def test_djikstra_dag() -> None:
+    # Two ways around a diamond, then a fork that rejoins at the end
+    edges = {
+        "a": [("b", 1), ("c", 1)],
+        "b": [("d", 1)],
+        "c": [("d", 1)],
+        "d": [("e", 1), ("f", 2), ("g", 1)],
+        "e": [("h", 2)],
+        "f": [("h", 1)],
+        "g": [("h", 5)],
+    }
+
+    def neighbors(node: str) -> Iterable[Tuple[str, int]]:
+        return edges.get(node, [])
+
+    dag = djikstra_dag("a", neighbors)
+    assert dag.costs["h"] == 5
+    assert dag.count_paths(["h"]) == 4
+    assert sorted(dag.paths(["h"])) == [
+        ["a", "b", "d", "e", "h"],
+        ["a", "b", "d", "f", "h"],
+        ["a", "c", "d", "e", "h"],
+        ["a", "c", "d", "f", "h"],
+    ]
+    assert dag.nodes_on_paths(["h"]) == {"a", "b", "c", "d", "e", "f", "h"}
+    # Only the nearest of several targets counts
+    assert dag.nodes_on_paths(["h", "g"]) == {"a", "b", "c", "d", "g"}
+    assert dag.count_paths(["z"]) == 0
+
+    partial = djikstra_dag("a", neighbors, targets=["d"])
+    assert "h" not in partial.costs
+    assert partial.count_paths(["d"]) == 2
+
+
+def test_indexed_graph() -> None:
+    walls = {(3, y) for y in range(8)} | {(6, y) for y in range(2, 10)}
+    neighbors = grid_neighbors(walls, 10)
+    graph: IndexedGraph[Tuple[int, int]] = IndexedGraph(
+        100, lambda p: p[1] * 10 + p[0], lambda i: (i % 10, i // 10)
+    )
+    assert graph.djikstra((0, 0), neighbors) == djikstra((0, 0), neighbors)
+    for end in [(9, 9), (9, 0), (0, 0)]:
+        path, cost = graph.astar_with_cost((0, 0), end, manhattan, neighbors)
+        assert cost == astar_with_cost((0, 0), end, manhattan, neighbors)[1]
+        assert path[0] == (0, 0) and path[-1] == end
+        assert sum(dict(neighbors(a))[b] for a, b in zip(path, path[1:])) == cost
+
+
+def test_indexed_grid() -> None:
+    graph = IndexedGraph.grid(Point(4, 3))
+    assert graph.size == 12
+    assert [graph.decode(graph.encode(Point(x, y))) for x, y in [(3, 2), (0, 1)]] == [
+        Point(3, 2),
+        Point(0, 1),
+    ]
+    for outside in [Point(-1, 1), Point(4, 0), Point(0, 3)]:
+        with pytest.raises(IndexError):
+            graph.encode(outside)
+
+
+def test_astar_search_stats() -> None:
+    # An admissible but inconsistent heuristic closes "c" via the slow route
+    edges = {
+        "s": [("a", 1), ("b", 2)],
+        "a": [("c", 5)],
+        "b": [("c", 1)],
+        "c": [("g", 10)],
+    }
+    estimates = {"b": 10}
+
+    def heuristic(node: str, end: str) -> int:
+        return estimates.get(node, 0)
+
+    def neighbors(node: str) -> Iterable[Tuple[str, int]]:
+        return edges.get(node, [])
+
+    result = astar_search(OptimizeWrapper("s", "g", heuristic, neighbors))
+    assert [node.current for node in result.path] == ["s", "b", "c", "g"]
+    assert result.cost == 13
+    stats = result.stats
+    assert (stats.expanded, stats.generated, stats.reopened) == (5, 6, 1)
+    assert (stats.pushes, stats.decrease_keys, stats.peak_open) == (7, 1, 2)
+
+    # Promising consistency skips the reopen, and here gets the wrong answer
+    result = astar_search(
+        OptimizeWrapper("s", "g", heuristic, neighbors), consistent=True
+    )
+    assert result.cost == 16
+    assert result.stats.reopened == 0
+
+
+def test_search_stats_collection() -> None:
+    neighbors = grid_neighbors({(2, y) for y in range(4)}, 5)
+    explicit = SearchStats(open_size_every=1, sample_every=2)
+    djikstra((0, 0), neighbors, stats=explicit)
+    assert explicit.expanded == 21
+    assert explicit.generated > explicit.pushes >= explicit.expanded
+    assert len(explicit.open_sizes) == explicit.expanded
+    assert all(sample.startswith("(") for sample in explicit.samples)
+    assert len(explicit.samples) == explicit.expanded // 2
+
+    with collect_search_stats() as collected:
+        astar_with_cost((0, 0), (4, 0), manhattan, neighbors)
+        djikstra((0, 0), neighbors, stats=explicit)
+    assert [stats.label for stats in collected] == ["astar", "search"]
+    assert collected[1] is explicit
+    assert json.loads(json.dumps(collected[0].to_json()))["expanded"] > 0
+
+    # Nothing is collected outside the block
+    djikstra((0, 0), neighbors)
+    assert len(collected) == 2
+
+
+def grid_start(size: int, walls: set[Tuple[int, int]]) -> OptimizeWrapper:
+    return OptimizeWrapper(
+        (0, 0), (size - 1, size - 1), manhattan, grid_neighbors(walls, size)
+    )
+
+
+def test_bounded_searches() -> None:
+    walls = {(3, y) for y in range(8)} | {(6, y) for y in range(2, 10)}
+    start = grid_start(10, walls)
+    optimal = astar_search(start).cost
+    # A wide beam finds the optimum; a narrow one finds some path
+    assert beam_search(start, 50).cost == optimal
+    narrow = beam_search(start, 2)
+    assert narrow.cost >= optimal
+
+    # IDA* and SMA* are tree searches, so keep their grid small
+    small_walls = {(2, y) for y in range(4)}
+    small = grid_start(5, small_walls)
+    small_optimal = astar_search(small).cost
+    assert ida_star(small).cost == small_optimal
+    bounded = memory_bounded_astar(small, 15)
+    assert bounded.cost == small_optimal
+    assert bounded.stats.pruned > 0
+
+    for result, grid_walls, size in [
+        (narrow, walls, 10),
+        (ida_star(small), small_walls, 5),
+        (bounded, small_walls, 5),
+    ]:
+        path = [node.current for node in result.path]
+        assert path[0] == (0, 0) and path[-1] == (size - 1, size - 1)
+        steps = grid_neighbors(grid_walls, size)
+        assert sum(dict(steps(a))[b] for a, b in zip(path, path[1:])) == result.cost
+
+
+def test_bounded_searches_without_a_path() -> None:
+    start = grid_start(4, {(3, 2), (2, 3)})
+    for search in [
+        ida_star,
+        lambda s: memory_bounded_astar(s, 20),
+        lambda s: beam_search(s, 3),
+    ]:
+        with pytest.raises(Exception, match="No path found"):
+            search(start)
+    with pytest.raises(MemoryError):
+        memory_bounded_astar(grid_start(10, set()), 2)
+    with pytest.raises(MemoryError):
+        memory_bounded_astar(grid_start(5, set()), 6)
+
+
+@pytest.mark.parametrize("queue", [IndexedPriorityQueue, BucketQueue, RadixHeap])
+def test_search_queues(queue: Callable[[], Queue[Any]]) -> None:
+    walls = {(3, y) for y in range(8)} | {(6, y) for y in range(2, 10)}
+    neighbors = grid_neighbors(walls, 10)
+    assert djikstra((0, 0), neighbors, queue=queue) == djikstra((0, 0), neighbors)
+    _, cost = astar_with_cost((0, 0), (9, 9), manhattan, neighbors, queue=queue)
+    assert cost == astar_with_cost((0, 0), (9, 9), manhattan, neighbors)[1]
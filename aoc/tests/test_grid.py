@@ -0,0 +1,77 @@
+import pytest
+from immutables import Map
+
+from aoc.common.grid import DenseGrid, Grid
+from aoc.common.point import Point
+
+TEXT = "AAB\nABB\nCCB"
+
+
+def test_dense_grid_matches_grid() -> None:
+    grid = Grid.parse(TEXT, str)
+    dense = DenseGrid.parse(TEXT, str)
+    assert str(dense) == str(grid) == TEXT
+    assert dense.lower_right_bound == grid.lower_right_bound
+    assert dict(dense.entries.items()) == dict(grid.entries.items())
+    assert list(dense.entries) == sorted(grid.entries, key=lambda p: (p.y, p.x))
+    assert dense.entries[Point(2, 1)] == "B"
+    assert Point(2, 2) in dense.entries and Point(3, 0) not in dense.entries
+    with pytest.raises(KeyError):
+        dense.entries[Point(-1, 0)]
+    assert dense.to_grid() == grid
+    assert DenseGrid.from_grid(grid) == dense
+    assert DenseGrid(Map(grid.entries), grid.lower_right_bound) == dense
+    with pytest.raises(ValueError):
+        DenseGrid(Map({Point(0, 0): "A"}), Point(2, 1))
+
+
+def test_dense_grid_mutation() -> None:
+    dense = DenseGrid.parse(TEXT, str)
+    with dense.entries.mutate() as mutation:
+        mutation[Point(0, 0)] = "Z"
+        mutation[Point(1, 2)] = "A"
+        changed = DenseGrid(mutation.finish(), dense.lower_right_bound)
+    assert str(changed) == "ZAB\nABB\nCAB"
+    # The original is untouched
+    assert str(dense) == TEXT
+    with pytest.raises(KeyError):
+        dense.entries.mutate()[Point(3, 3)] = "A"
+
+
+def test_dense_grid_mutation_after_finish() -> None:
+    dense = DenseGrid.parse(TEXT, str)
+    mutation = dense.entries.mutate()
+    mutation[Point(0, 0)] = "Z"
+    assert mutation[Point(0, 0)] == "Z"
+    finished = mutation.finish()
+    with pytest.raises(ValueError):
+        mutation[Point(1, 0)] = "Y"
+    assert finished[Point(1, 0)] == "A"
+    with dense.entries.mutate() as mutation:
+        pass
+    with pytest.raises(ValueError):
+        mutation[Point(0, 0)] = "Z"
+
+
+def test_dense_grid_masks() -> None:
+    dense = DenseGrid.parse(TEXT, str)
+    assert dense.mask("B").tolist() == [
+        [False, False, True],
+        [False, True, True],
+        [False, False, True],
+    ]
+    up, right, down, left = dense.neighbor_masks()
+    assert up.tolist() == [
+        [False, False, False],
+        [True, False, True],
+        [False, False, True],
+    ]
+    assert right[0].tolist() == [True, False, False]
+    assert down[:, 2].tolist() == [True, True, False]
+    assert left[2].tolist() == [False, True, False]
+    # Cells with a C directly below
+    assert dense.neighbor_masks("C")[2].tolist() == [
+        [False, False, False],
+        [True, True, False],
+        [False, False, False],
+    ]
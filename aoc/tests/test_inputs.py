@@ -0,0 +1,12 @@
+from aoc.solutions.year2024 import day01
+from aoc.utils.inputs import InputKind, as_lines, input_kind
+
+EXAMPLE = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3"
+
+
+def test_line_parts_accept_whole_input() -> None:
+    assert input_kind(day01.part1) == InputKind.LINES
+    assert day01.part1(EXAMPLE) == day01.part1(iter(EXAMPLE.splitlines())) == 11
+    assert day01.part2(EXAMPLE) == 31
+    lines = iter(["a", "b"])
+    assert as_lines(lines) is lines
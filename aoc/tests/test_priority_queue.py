@@ -1,4 +1,16 @@
-from aoc.common.priority_queue import PriorityQueue
+import random
+from typing import Dict
+
+import pytest
+
+from aoc.common.priority_queue import (
+    BucketQueue,
+    IndexedPriorityQueue,
+    PriorityQueue,
+    RadixHeap,
+)
+
+QUEUE_TYPES = [PriorityQueue, IndexedPriorityQueue, BucketQueue, RadixHeap]
 
 
 def test_queue() -> None:
@@ -8,3 +20,134 @@ def test_queue() -> None:
     queue.push("hello", 0)
     assert queue.pop() == "hello"
     assert queue.pop() == "world"
+
+
+@pytest.mark.parametrize("queue_type", QUEUE_TYPES)
+def test_queue_priority_changes(queue_type: type) -> None:
+    queue = queue_type()
+    for i, item in enumerate("abcde"):
+        queue.push(item, 10 * i)
+    queue.push("e", 5)
+    queue.push("a", 25)
+    queue.remove("c")
+    assert "c" not in queue and "e" in queue
+    assert queue.heap_size >= len(queue) == 4
+    assert queue.peek_priority() == 5
+    popped = [queue.pop_with_priorty() for _ in range(4)]
+    assert popped == [("e", 5), ("b", 10), ("a", 25), ("d", 30)]
+
+
+@pytest.mark.parametrize("queue_type", QUEUE_TYPES)
+def test_queue_matches_sorting(queue_type: type) -> None:
+    rng = random.Random(0)
+    queue = queue_type()
+    expected: Dict[int, int] = {}
+    for _ in range(5000):
+        item, priority = rng.randrange(500), rng.randrange(1000)
+        queue.push(item, priority)
+        expected[item] = priority
+    assert len(queue) == len(expected)
+    popped = [queue.pop_with_priorty()[1] for _ in range(len(expected))]
+    assert popped == sorted(expected.values())
+
+
+def test_queue_compacts_stale_entries() -> None:
+    queue: PriorityQueue[int] = PriorityQueue()
+    for item in range(2000):
+        queue.push(item, 10_000)
+    for priority in range(10):
+        for item in range(2000):
+            queue.push(item, priority * 100 + item)
+    # Each rebuild leaves at most one stale entry per live one
+    assert queue.heap_size <= 2 * len(queue) + 1
+    assert queue.pop_with_priorty() == (0, 900)
+
+
+@pytest.mark.parametrize("queue_type", [BucketQueue, RadixHeap])
+def test_monotone_queues(queue_type: type) -> None:
+    rng = random.Random(0)
+    queue = queue_type()
+    queue.push(0, 0)
+    popped = []
+    while queue and len(popped) < 2000:
+        item, priority = queue.pop_with_priorty()
+        popped.append(priority)
+        for step in [1, 1000, rng.randint(0, 50)]:
+            queue.push(rng.randrange(300), priority + step)
+    assert popped == sorted(popped)
+    with pytest.raises(ValueError):
+        queue.push(-1, popped[-1] - 1)
+
+
+def test_queue_remove_accounting() -> None:
+    queue: PriorityQueue[int] = PriorityQueue()
+    for item in range(10):
+        queue.push(item, item)
+    for item in range(0, 10, 2):
+        queue.remove(item)
+    assert len(queue) == 5 and 4 not in queue
+    assert queue.stale_ratio == 0.5
+    assert [queue.pop() for _ in range(5)] == [1, 3, 5, 7, 9]
+    assert not queue and len(queue) == 0
+    with pytest.raises(Exception, match="Pop from empty queue"):
+        queue.pop()
+
+
+def test_queue_mixed_workload() -> None:
+    rng = random.Random(0)
+    queue: PriorityQueue[int] = PriorityQueue()
+    expected: Dict[int, int] = {}
+    peak_heap = 0
+    for step in range(1_000_000):
+        roll = rng.random()
+        if roll < 0.5:
+            item, priority = rng.randrange(50_000), rng.randrange(1_000_000)
+            queue.push(item, priority)
+            expected[item] = priority
+        elif roll < 0.75 and expected:
+            item = next(iter(expected))
+            queue.remove(item)
+            del expected[item]
+        elif expected:
+            if step % 100_000 == 0:
+                assert queue.peek_priority() == min(expected.values())
+            item, priority = queue.pop_with_priorty()
+            assert expected.pop(item) == priority
+        peak_heap = max(peak_heap, queue.heap_size)
+        assert len(queue) == len(expected)
+    assert queue.stale_ratio <= queue.max_stale_ratio
+    # Tombstones never let the heap grow past twice the live items
+    assert peak_heap <= 2 * 50_000 + 1
+    drained = [queue.pop_with_priorty()[1] for _ in range(len(queue))]
+    assert drained == sorted(expected.values())
+    assert not queue
+
+
+@pytest.mark.parametrize("queue_type", QUEUE_TYPES)
+def test_queue_push_many(queue_type: type) -> None:
+    queue = queue_type()
+    queue.push_many([("a", 5), ("b", 3), ("a", 1), ("c", 4)])
+    assert len(queue) == 3
+    # A small batch into a larger heap, updating a queued item
+    queue.push_many((str(i), 10 + i) for i in range(100))
+    queue.push_many([("c", 2), ("d", 6)])
+    assert [queue.pop_with_priorty() for _ in range(4)] == [
+        ("a", 1),
+        ("c", 2),
+        ("b", 3),
+        ("d", 6),
+    ]
+    assert len(queue) == 100
+
+
+def test_queue_pop_many_and_drain() -> None:
+    queue: PriorityQueue[int] = PriorityQueue()
+    queue.push_many((i, i) for i in reversed(range(10)))
+    assert queue.pop_many(3) == [(0, 0), (1, 1), (2, 2)]
+    drained = []
+    for item, priority in queue.drain():
+        drained.append(item)
+        if item == 5:
+            queue.push(100, 100)
+    assert drained == [3, 4, 5, 6, 7, 8, 9, 100]
+    assert queue.pop_many(5) == []
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from typing import Dict
+
+# Everything `aoc solve` imports before it loads the solution itself
+SOLVE_MODULES = ["aoc.run", "aoc.utils.cache", "aoc.utils.runner", "aoc.utils.sandbox"]
+HEAVY_MODULES = {"anthropic", "bs4", "requests", "yaml"}
+# Cumulative import time of the modules above, in microseconds. This is
+# several times the ~30ms measured locally to leave room for slow CI machines.
+IMPORT_BUDGET_US = 250_000
+
+
+def import_times() -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module ``aoc solve`` loads."""
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        f"import {', '.join(SOLVE_MODULES)}",
+    ]
+    # Warm up first so stale bytecode being recompiled isn't counted
+    subprocess.run(command, capture_output=True, check=True)
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_solve_skips_heavy_imports() -> None:
+    loaded = {name.split(".")[0] for name in import_times()}
+    assert not loaded & HEAVY_MODULES
+
+
+def test_solve_import_budget() -> None:
+    times = import_times()
+    total = sum(times[name] for name in SOLVE_MODULES)
+    assert total < IMPORT_BUDGET_US
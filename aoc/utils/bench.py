@@ -0,0 +1,156 @@
+"""Repeatable benchmarks of solution runtimes.
+
+Each task is warmed up and then timed ``runs`` times in a worker process,
+either on the real puzzle input or on synthetic inputs of increasing size.
+Runs are appended to a JSON history file so later runs can be compared with
+``--compare`` to catch regressions.
+"""
+
+import json
+import statistics
+import subprocess
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from aoc.utils.finder import PROJECT_PATH, get_day
+from aoc.utils.generators import generate
+from aoc.utils.runner import Task
+
+HISTORY_PATH = PROJECT_PATH.parent / ".aoc_cache" / "bench_history.json"
+
+
+@dataclass
+class BenchResult:
+    task: Task
+    timings: List[float]
+    error: str | None = None
+    size: int | None = None
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def p95(self) -> float:
+        ordered = sorted(self.timings)
+        return ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "year": self.task.year,
+            "day": self.task.day,
+            "part": self.task.part,
+            "size": self.size,
+            "timings": self.timings,
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "stdev": self.stdev,
+        }
+
+
+@dataclass(frozen=True)
+class BenchSettings:
+    runs: int = 10
+    warmup: int = 1
+    size: int | None = None
+
+    def __call__(self, task: Task) -> BenchResult:
+        day = get_day(task.year, task.day)
+        if day is None:
+            return BenchResult(task, [], "Missing solution", self.size)
+        if self.size is None and not day.input_path.exists():
+            return BenchResult(task, [], "Missing input", self.size)
+        text = generate(task.year, task.day, self.size) if self.size else None
+
+        def run() -> None:
+            if text is None:
+                with day.prepared_input(task.part) as parsed:
+                    day.solve_part(task.part, parsed)
+            else:
+                parsed = day.parse_input(day.adapt_text(task.part, text))
+                day.solve_part(task.part, parsed)
+
+        timings: List[float] = []
+        try:
+            for _ in range(self.warmup):
+                run()
+            for _ in range(self.runs):
+                start = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - start)
+        except Exception as e:
+            error = "".join(traceback.format_exception_only(e)).strip()
+            return BenchResult(task, [], error, self.size)
+        return BenchResult(task, timings, size=self.size)
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(results: List[BenchResult], path: Path) -> Dict[str, Any]:
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": _git_revision(),
+        "results": [r.to_json() for r in results if not r.error],
+    }
+    history: List[Dict[str, Any]] = []
+    if path.exists():
+        history = json.loads(path.read_text())
+    history.append(record)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2) + "\n")
+    return record
+
+
+Baseline = Dict[Tuple[Task, int | None], float]
+
+
+def load_baseline(path: Path) -> Baseline:
+    """Median runtimes from a history file (its latest run) or a single run."""
+    data = json.loads(path.read_text())
+    if isinstance(data, list):
+        data = data[-1]
+    return {
+        (Task(entry["year"], entry["day"], entry["part"]), entry.get("size")): entry[
+            "median"
+        ]
+        for entry in data["results"]
+    }
+
+
+def find_regressions(
+    results: List[BenchResult], baseline: Baseline, threshold: float
+) -> List[tuple[BenchResult, float]]:
+    """Results whose median is more than ``threshold`` slower than baseline."""
+    regressions = []
+    for result in results:
+        base = baseline.get((result.task, result.size))
+        if result.error or base is None or base <= 0:
+            continue
+        change = result.median / base - 1
+        if change > threshold:
+            regressions.append((result, change))
+    return regressions
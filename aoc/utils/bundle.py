@@ -0,0 +1,139 @@
+"""Every example and puzzle input compiled into one memory-mapped file.
+
+``aoc bundle`` parses each ``examples/{year}/{day}.yaml`` once and stores the
+result with ``marshal``; inputs are stored as raw bytes. The file starts with
+an index from each source's path (relative to the project root) to where its
+blob lives, so a lookup is a dict access and a slice of the ``mmap`` with no
+YAML parsing.
+
+Entries remember the mtime, size and SHA-256 of their source. An entry whose
+source has changed is ignored, and callers fall back to reading the source
+itself, so a stale bundle is only ever slower, never wrong.
+"""
+
+import hashlib
+import marshal
+import mmap
+import struct
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+BUNDLE_PATH = ROOT / ".aoc_cache" / "bundle.bin"
+MAGIC = b"AOCBNDL1"
+HEADER = struct.Struct("<8sQ")
+
+# (offset, length, mtime_ns, size, sha256) of a source's blob, with the offset
+# counted from the end of the index
+Entry = Tuple[int, int, int, int, str]
+
+
+def _is_fresh(source: Path, entry: Entry) -> bool:
+    _, _, mtime_ns, size, digest = entry
+    try:
+        stat = source.stat()
+    except FileNotFoundError:
+        return False
+    if stat.st_size != size:
+        return False
+    if stat.st_mtime_ns == mtime_ns:
+        return True
+    # Touched but possibly unchanged, e.g. after a checkout
+    return hashlib.sha256(source.read_bytes()).hexdigest() == digest
+
+
+@dataclass
+class Bundle:
+    data: mmap.mmap
+    index: Dict[str, Entry]
+    start: int
+    root: Path = ROOT
+
+    @classmethod
+    def open(cls, path: Path = BUNDLE_PATH, root: Path = ROOT) -> "Bundle | None":
+        if not path.exists() or path.stat().st_size < HEADER.size:
+            return None
+        with path.open("rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            return None
+        start = HEADER.size + index_length
+        return cls(data, marshal.loads(data[HEADER.size : start]), start, root)
+
+    def get(self, source: Path) -> memoryview | None:
+        """The bundled bytes of ``source``, or None if missing or stale."""
+        try:
+            key = source.absolute().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        entry = self.index.get(key)
+        if entry is None or not _is_fresh(source, entry):
+            return None
+        offset, length, *_ = entry
+        start = self.start + offset
+        return memoryview(self.data)[start : start + length]
+
+    def example(self, source: Path) -> Dict[str, Any] | None:
+        """The parsed example YAML at ``source``."""
+        blob = self.get(source)
+        return None if blob is None else marshal.loads(blob)
+
+
+def _sources(root: Path) -> Dict[Path, str]:
+    """Each bundled file and whether it holds an ``example`` or an ``input``."""
+    sources = {path: "example" for path in root.glob("examples/*/*.yaml")}
+    sources.update({path: "input" for path in root.glob("inputs/*/*.txt")})
+    return dict(sorted(sources.items()))
+
+
+def build_bundle(path: Path = BUNDLE_PATH, root: Path = ROOT) -> int:
+    """Compile every example and input under ``root`` into ``path``.
+
+    Returns the number of files bundled.
+    """
+    from yaml import safe_load
+
+    blobs = []
+    index: Dict[str, Entry] = {}
+    offset = 0
+    for source, kind in _sources(root).items():
+        raw = source.read_bytes()
+        blob = raw
+        if kind == "example":
+            try:
+                blob = marshal.dumps(safe_load(raw))
+            except ValueError:
+                # Values marshal can't store; readers fall back to the YAML
+                continue
+        stat = source.stat()
+        index[source.relative_to(root).as_posix()] = (
+            offset,
+            len(blob),
+            stat.st_mtime_ns,
+            stat.st_size,
+            hashlib.sha256(raw).hexdigest(),
+        )
+        blobs.append(blob)
+        offset += len(blob)
+
+    encoded_index = marshal.dumps(index)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so a concurrent reader never maps a partial file
+    partial = path.with_suffix(".tmp")
+    with partial.open("wb") as f:
+        f.write(HEADER.pack(MAGIC, len(encoded_index)))
+        f.write(encoded_index)
+        for blob in blobs:
+            f.write(blob)
+    partial.replace(path)
+    load_bundle.cache_clear()
+    return len(index)
+
+
+@cache
+def load_bundle() -> Bundle | None:
+    """The project's bundle, if ``aoc bundle`` has been run."""
+    return Bundle.open()
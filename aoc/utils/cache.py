@@ -0,0 +1,90 @@
+"""On-disk cache of solved answers.
+
+Answers are keyed by the year, day and part together with a hash of the
+solution's source and a hash of the puzzle input. The source hash also covers
+any ``aoc`` modules the solution imports (e.g. ``aoc.common.graph``), so a
+change to shared code invalidates the days that use it. Entries are evicted
+least-recently-used first once the cache grows past ``max_bytes``.
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.utils.finder import PROJECT_PATH, Day, get_day
+from aoc.utils.runner import Task, TaskResult
+from aoc.utils.sources import source_files
+
+CACHE_DIR = PROJECT_PATH.parent / ".aoc_cache"
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+ENTRY_SUFFIX = ".answer.json"
+# Entries were once named plainly after their key
+LEGACY_ENTRY = re.compile(r"[0-9a-f]{64}\.json")
+
+
+def source_hash(day: Day) -> str:
+    digest = hashlib.sha256()
+    for path in source_files(day.module_path):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def input_hash(day: Day) -> str:
+    with day.input_path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@dataclass
+class AnswerCache:
+    path: Path = CACHE_DIR
+    max_bytes: int = DEFAULT_MAX_BYTES
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def key(self, task: Task) -> str | None:
+        day = get_day(task.year, task.day)
+        if day is None or not day.input_path.exists():
+            return None
+        parts = [task.year, task.day, task.part, source_hash(day), input_hash(day)]
+        return hashlib.sha256(":".join(map(str, parts)).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, task: Task) -> TaskResult | None:
+        key = self.key(task)
+        entry_path = self._entry_path(key) if key else None
+        if entry_path is None or not entry_path.exists():
+            self.misses += 1
+            return None
+        entry = json.loads(entry_path.read_text())
+        # Touch the entry so eviction sees it as recently used
+        os.utime(entry_path)
+        self.hits += 1
+        return TaskResult(task, entry["answer"], entry["wall_time"], cached=True)
+
+    def put(self, result: TaskResult) -> None:
+        key = self.key(result.task)
+        if key is None or result.error is not None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._entry_path(key).write_text(
+            json.dumps({"answer": result.answer, "wall_time": result.wall_time})
+        )
+        self.evict()
+
+    def evict(self) -> None:
+        for legacy_path in self.path.glob("*.json"):
+            if LEGACY_ENTRY.fullmatch(legacy_path.name):
+                legacy_path.rename(self._entry_path(legacy_path.name[:64]))
+        # Only answers count: other tools keep their own files alongside
+        entries = [(p, p.stat()) for p in self.path.glob(f"*{ENTRY_SUFFIX}")]
+        total = sum(stat.st_size for _, stat in entries)
+        for entry_path, stat in sorted(entries, key=lambda x: x[1].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink()
+            total -= stat.st_size
@@ -1,24 +1,136 @@
+from contextlib import contextmanager
 from dataclasses import dataclass
-from importlib import util
+from functools import cached_property
+from importlib import import_module
 from pathlib import Path
 from types import ModuleType
-from typing import List
+from typing import Any, Dict, Iterator, List
 
-from yaml import safe_load
+from aoc.utils.bundle import load_bundle
+from aoc.utils.inputs import InputKind, from_text, input_kind, open_input
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
 
 
 @dataclass
 class Day:
+    """A solved day, discovered from its filename alone.
+
+    The solution module, example YAML and puzzle input are each loaded the
+    first time they are accessed.
+    """
+
     year: int
     day_number: int
-    module: ModuleType
-    solution_input: str | None
-    example_input: str | list[str]
-    example_answers: List[str]
 
     def __str__(self) -> str:
         return f"Day {self.day_number} ({self.year})"
 
+    @property
+    def module_name(self) -> str:
+        return f"aoc.solutions.year{self.year}.day{self.day_number:02d}"
+
+    @property
+    def module_path(self) -> Path:
+        return (
+            PROJECT_PATH
+            / "solutions"
+            / f"year{self.year}"
+            / f"day{self.day_number:02d}.py"
+        )
+
+    @property
+    def example_path(self) -> Path:
+        return (
+            PROJECT_PATH.parent
+            / "examples"
+            / str(self.year)
+            / f"{self.day_number:02d}.yaml"
+        )
+
+    @property
+    def input_path(self) -> Path:
+        return (
+            PROJECT_PATH.parent
+            / "inputs"
+            / str(self.year)
+            / f"{self.day_number:02d}.txt"
+        )
+
+    @cached_property
+    def module(self) -> ModuleType:
+        return import_module(self.module_name)
+
+    @cached_property
+    def solution_input(self) -> str | None:
+        bundle = load_bundle()
+        data = bundle.get(self.input_path) if bundle else None
+        if data is not None:
+            return str(data, "utf-8")
+        if self.input_path.exists():
+            return self.input_path.read_text()
+        return None
+
+    @cached_property
+    def _example_yaml(self) -> Dict[str, Any]:
+        bundle = load_bundle()
+        example = bundle.example(self.example_path) if bundle else None
+        if example is not None:
+            return example
+
+        from yaml import safe_load
+
+        return safe_load(self.example_path.read_text())
+
+    @cached_property
+    def example_input(self) -> str | list[str]:
+        example_input = self._example_yaml["input"]
+        if isinstance(example_input, list):
+            return [str(x) for x in example_input]
+        return str(example_input)
+
+    @cached_property
+    def example_answers(self) -> List[str]:
+        return [str(x) for x in self._example_yaml["answers"]]
+
+    @cached_property
+    def example_budget(self) -> float | None:
+        """Seconds all example parts may take together, from ``budget:``."""
+        budget = self._example_yaml.get("budget")
+        return None if budget is None else float(budget)
+
+    @property
+    def has_parse_hook(self) -> bool:
+        return hasattr(self.module, "parse")
+
+    def parse_input(self, text: Any) -> Any:
+        """Run the module's optional ``parse`` hook.
+
+        Solutions that define ``parse(text)`` receive its result in both
+        ``part1`` and ``part2`` instead of the raw text, so the input only has
+        to be parsed once. Parts must not mutate the parsed value.
+        """
+        parse = getattr(self.module, "parse", None)
+        return text if parse is None else parse(text)
+
+    def solve_part(self, part: int, parsed: Any) -> Any:
+        return getattr(self.module, f"part{part}")(parsed)
+
+    def input_kind(self, part: int) -> InputKind:
+        """How the module wants its input: text, a line iterator or bytes."""
+        if self.has_parse_hook:
+            return input_kind(self.module.parse)
+        return input_kind(getattr(self.module, f"part{part}"))
+
+    def adapt_text(self, part: int, text: str) -> Any:
+        return from_text(text, self.input_kind(part))
+
+    @contextmanager
+    def prepared_input(self, part: int) -> Iterator[Any]:
+        """The puzzle input, streamed as the module asks and then parsed."""
+        with open_input(self.input_path, self.input_kind(part)) as data:
+            yield self.parse_input(data)
+
     def example_input_for_part(self, part: int):
         if isinstance(self.example_input, list):
             return self.example_input[part]
@@ -27,54 +139,28 @@ class Day:
 
 def get_days(years: List[int] | None = None) -> List[Day]:
     days: List[Day] = []
-    project_path = Path(__file__).resolve().parent.parent
     if years is None:
         years = [
             int(d.name[4:])
-            for d in (project_path / "solutions").iterdir()
-            if d.is_dir()
+            for d in (PROJECT_PATH / "solutions").iterdir()
+            if d.is_dir() and d.name.startswith("year")
         ]
 
     for year in years:
-        solutions_path = project_path / "solutions" / f"year{year}"
+        solutions_path = PROJECT_PATH / "solutions" / f"year{year}"
         if not solutions_path.exists():
-            return []
+            continue
 
-        examples_path = project_path.parent / "examples" / str(year)
-        inputs = project_path.parent / "inputs" / str(year)
-
-        for py_file in solutions_path.glob("*.py"):
+        for py_file in solutions_path.glob("day*.py"):
             day_number = py_file.name[-5:-3]
             if not day_number.isnumeric():
                 continue
-            spec = util.spec_from_file_location("", py_file)
-            if not spec:
-                raise Exception(f"Unable to load module {py_file}")
-            module = util.module_from_spec(spec)
-            if not spec.loader:
-                raise Exception(f"Unable to load module {py_file}")
-            spec.loader.exec_module(module)
-
-            example_yaml = safe_load((examples_path / f"{day_number}.yaml").read_text())
-
-            solution_input = None
-            solution_path = inputs / f"{day_number}.txt"
-            if solution_path.exists():
-                solution_input = solution_path.read_text()
-
-            example_input = example_yaml["input"]
-            if isinstance(example_input, list):
-                example_input = [str(x) for x in example_input]
-            else:
-                example_input = str(example_input)
-            days.append(
-                Day(
-                    year,
-                    int(day_number),
-                    module,
-                    solution_input,
-                    example_input,
-                    [str(x) for x in example_yaml["answers"]],
-                )
-            )
+            days.append(Day(year, int(day_number)))
     return sorted(days, key=lambda x: (x.year, x.day_number))
+
+
+def get_day(year: int, day_number: int) -> Day | None:
+    day = Day(year, day_number)
+    if not day.module_path.exists():
+        return None
+    return day
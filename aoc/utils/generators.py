@@ -0,0 +1,105 @@
+"""Synthetic puzzle inputs of any size for scaling benchmarks.
+
+Each generator takes a size ``n`` and a seeded ``random.Random`` and returns
+text in the same format as that day's real input, so runtime can be measured
+against input size to catch super-linear blowups.
+"""
+
+import math
+import random
+from typing import Callable, Dict, List, Set, Tuple
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: Dict[Tuple[int, int], Generator] = {}
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    def register(func: Generator) -> Generator:
+        GENERATORS[(year, day)] = func
+        return func
+
+    return register
+
+
+def generate(year: int, day: int, n: int, seed: int = 0) -> str:
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No input generator for {year} day {day}")
+    return GENERATORS[(year, day)](n, random.Random(seed))
+
+
+@generator(2022, 20)
+def mixing_list(n: int, rng: random.Random) -> str:
+    """``n`` ints, one per line, containing exactly one zero."""
+    values = [rng.choice([-1, 1]) * rng.randint(1, 10_000) for _ in range(n - 1)]
+    values.insert(rng.randrange(n), 0)
+    return "\n".join(map(str, values))
+
+
+@generator(2024, 1)
+def location_lists(n: int, rng: random.Random) -> str:
+    """``n`` rows of two location IDs."""
+    return "\n".join(
+        f"{rng.randint(10_000, 99_999)}   {rng.randint(10_000, 99_999)}"
+        for _ in range(n)
+    )
+
+
+def _guard_escapes(rows: List[List[str]], x: int, y: int) -> bool:
+    n = len(rows)
+    dx, dy = 0, -1
+    seen: Set[Tuple[int, int, int, int]] = set()
+    while 0 <= x < n and 0 <= y < n:
+        if (x, y, dx, dy) in seen:
+            return False
+        seen.add((x, y, dx, dy))
+        if 0 <= x + dx < n and 0 <= y + dy < n and rows[y + dy][x + dx] == "#":
+            dx, dy = -dy, dx
+        else:
+            x, y = x + dx, y + dy
+    return True
+
+
+@generator(2024, 6)
+def guard_lab(n: int, rng: random.Random) -> str:
+    """An ``n`` x ``n`` lab with ~5% obstructions the guard can walk out of."""
+    while True:
+        rows: List[List[str]] = [
+            ["#" if rng.random() < 0.05 else "." for _ in range(n)] for _ in range(n)
+        ]
+        guard_x, guard_y = rng.randrange(n), rng.randrange(n)
+        rows[guard_y][guard_x] = "^"
+        if _guard_escapes(rows, guard_x, guard_y):
+            return "\n".join("".join(row) for row in rows)
+
+
+@generator(2024, 9)
+def disk_map(n: int, rng: random.Random) -> str:
+    """A disk map of ``n`` digits, alternating file and free-space lengths."""
+    n = max(1, n if n % 2 else n - 1)
+    return "".join(
+        str(rng.randint(1, 9) if idx % 2 == 0 else rng.randint(0, 9))
+        for idx in range(n)
+    )
+
+
+@generator(2024, 11)
+def stones(n: int, rng: random.Random) -> str:
+    """``n`` stones engraved with numbers of up to seven digits."""
+    return " ".join(str(rng.randint(0, 10 ** rng.randint(1, 7) - 1)) for _ in range(n))
+
+
+def scaling_exponent(sizes: List[int], timings: List[float]) -> float | None:
+    """Least-squares slope of log(time) against log(size).
+
+    Roughly 1 for linear algorithms, 2 for quadratic and so on.
+    """
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, timings) if t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
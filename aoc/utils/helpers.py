@@ -7,7 +7,7 @@ during interactive development with cell markers (# %%).
 from pathlib import Path
 from typing import Any
 
-from yaml import safe_load
+from aoc.utils.bundle import load_bundle
 
 
 def _get_project_root() -> Path:
@@ -30,6 +30,10 @@ def solution_input(year: int, day: int) -> str:
         >>> inp = solution_input(2024, 1)
     """
     input_file = _get_project_root() / "inputs" / str(year) / f"{day:02d}.txt"
+    bundle = load_bundle()
+    data = bundle.get(input_file) if bundle else None
+    if data is not None:
+        return str(data, "utf-8")
     if input_file.exists():
         return input_file.read_text()
     return ""
@@ -38,8 +42,15 @@ def solution_input(year: int, day: int) -> str:
 def _load_example_yaml(year: int, day: int) -> dict[str, Any]:
     """Load and parse the example YAML file for a given day."""
     example_file = _get_project_root() / "examples" / str(year) / f"{day:02d}.yaml"
+    bundle = load_bundle()
+    example = bundle.example(example_file) if bundle else None
+    if example is not None:
+        return example
     if not example_file.exists():
         return {}
+
+    from yaml import safe_load
+
     return safe_load(example_file.read_text()) or {}
 
 
@@ -0,0 +1,114 @@
+"""Hand puzzle input to a solution in the form its signature asks for.
+
+Solutions normally take the whole input as one ``str``. A solution (or its
+``parse`` hook) can instead annotate its argument as:
+
+* ``Iterable[str]`` / ``Iterator[str]`` to receive the lines one at a time,
+  without trailing newlines, read lazily from the input file.
+* ``collections.abc.Buffer`` / ``bytes`` to receive a read-only ``mmap`` of
+  the input file.
+
+Either way the input is never fully materialized as a ``str``, so
+line-oriented days can process inputs far larger than memory.
+"""
+
+import inspect
+import mmap
+import types
+import typing
+from collections.abc import Buffer, Generator, Iterable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.utils.bundle import load_bundle
+
+
+class InputKind(Enum):
+    TEXT = "text"
+    LINES = "lines"
+    BYTES = "bytes"
+
+
+BYTES_TYPES = (Buffer, bytes, mmap.mmap, memoryview)
+
+
+def _kind_of(annotation: Any) -> InputKind:
+    if annotation in BYTES_TYPES:
+        return InputKind.BYTES
+    origin = typing.get_origin(annotation)
+    if origin in (Iterable, Iterator) and typing.get_args(annotation) == (str,):
+        return InputKind.LINES
+    if origin in (typing.Union, types.UnionType):
+        if all(arg in BYTES_TYPES for arg in typing.get_args(annotation)):
+            return InputKind.BYTES
+    return InputKind.TEXT
+
+
+def input_kind(func: Callable[..., Any]) -> InputKind:
+    """The kind of input ``func``'s first parameter is annotated to accept."""
+    try:
+        signature = inspect.signature(func, eval_str=True)
+    except (NameError, TypeError, ValueError):
+        return InputKind.TEXT
+    parameters = list(signature.parameters.values())
+    if not parameters:
+        return InputKind.TEXT
+    return _kind_of(parameters[0].annotation)
+
+
+def from_text(text: str, kind: InputKind) -> Any:
+    """Adapt an in-memory input such as an example to ``kind``."""
+    match kind:
+        case InputKind.LINES:
+            return iter(text.splitlines())
+        case InputKind.BYTES:
+            return text.encode()
+        case _:
+            return text
+
+
+def as_lines(lines: Iterable[str]) -> Iterable[str]:
+    """``lines`` as lines, also when given the whole input as one ``str``.
+
+    A ``str`` is an ``Iterable[str]`` of characters, so parts that stream
+    lines call this first to keep working when handed ``solution_input()``
+    directly, as the ``# %%`` cells do.
+    """
+    return lines.splitlines() if isinstance(lines, str) else lines
+
+
+def _read_lines(path: Path) -> Generator[str, None, None]:
+    with path.open() as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+@contextmanager
+def open_input(path: Path, kind: InputKind) -> Iterator[Any]:
+    """Open the input file at ``path`` as ``kind`` for the duration of a run.
+
+    Whole-file kinds are served from the compiled bundle when it's up to date.
+    """
+    bundle = load_bundle() if kind != InputKind.LINES else None
+    data = bundle.get(path) if bundle else None
+    if data is not None:
+        yield str(data, "utf-8") if kind == InputKind.TEXT else data
+        return
+    match kind:
+        case InputKind.LINES:
+            lines = _read_lines(path)
+            try:
+                yield lines
+            finally:
+                lines.close()
+        case InputKind.BYTES:
+            with path.open("rb") as f:
+                if path.stat().st_size == 0:
+                    yield b""
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    yield data
+        case _:
+            yield path.read_text()
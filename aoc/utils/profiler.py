@@ -0,0 +1,156 @@
+"""Measure what each part of a solution costs.
+
+Every part is profiled in its own worker process so that peak RSS belongs to
+that part alone. The part is run twice: once uninstrumented for wall time,
+CPU time and peak RSS, and once under ``tracemalloc`` and ``cProfile`` for
+peak allocation. Parse time is measured directly for solutions with a
+``parse`` hook. For the rest it is the share of the instrumented run spent in
+the solution's top-level ``parse*`` functions, applied to the uninstrumented
+wall time.
+
+Searches from ``aoc.common.graph`` run during the instrumented pass report
+their ``SearchStats``, which are summed into the table and kept in full in
+the JSON output.
+"""
+
+import cProfile
+import json
+import pstats
+import resource
+import sys
+import time
+import traceback
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from aoc.common.search_stats import collect_search_stats
+from aoc.utils.finder import PROJECT_PATH, get_day
+from aoc.utils.runner import Task
+
+
+@dataclass
+class PartProfile:
+    task: Task
+    answer: str | None
+    wall_time: float
+    cpu_time: float
+    parse_time: float
+    compute_time: float
+    peak_rss: int
+    peak_alloc: int
+    error: str | None = None
+    searches: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def expanded(self) -> int:
+        return sum(search["expanded"] for search in self.searches)
+
+
+def _peak_rss() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _is_parse_function(key: tuple[str, int, str]) -> bool:
+    filename, _, name = key
+    return name.startswith("parse") and filename.startswith(str(PROJECT_PATH))
+
+
+def _parse_fraction(profiler: cProfile.Profile, total: float) -> float:
+    stats: dict[Any, Any] = pstats.Stats(profiler).stats  # type: ignore
+    parse_time = 0.0
+    for key, (_, _, _, cumulative, callers) in stats.items():
+        if _is_parse_function(key) and not any(
+            _is_parse_function(caller) for caller in callers
+        ):
+            parse_time += cumulative
+    return min(1.0, parse_time / total) if total > 0 else 0.0
+
+
+def profile_part(task: Task) -> PartProfile:
+    day = get_day(task.year, task.day)
+    if day is None or not day.input_path.exists():
+        return PartProfile(task, None, 0, 0, 0, 0, 0, 0, "Missing solution or input")
+    has_parse_hook = day.has_parse_hook
+
+    def solution() -> Any:
+        with day.prepared_input(task.part) as parsed:
+            return day.solve_part(task.part, parsed)
+
+    try:
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        with day.prepared_input(task.part) as parsed:
+            parse_time = time.perf_counter() - wall_start
+            answer = day.solve_part(task.part, parsed)
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        peak_rss = _peak_rss()
+
+        profiler = cProfile.Profile()
+        tracemalloc.start()
+        instrumented_start = time.perf_counter()
+        with collect_search_stats() as searches:
+            profiler.runcall(solution)
+        instrumented_time = time.perf_counter() - instrumented_start
+        _, peak_alloc = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    except Exception as e:
+        error = "".join(traceback.format_exception_only(e)).strip()
+        return PartProfile(task, None, 0, 0, 0, 0, 0, 0, error)
+
+    if not has_parse_hook:
+        parse_time = wall_time * _parse_fraction(profiler, instrumented_time)
+    return PartProfile(
+        task,
+        None if answer is None else str(answer),
+        wall_time,
+        cpu_time,
+        parse_time,
+        wall_time - parse_time,
+        peak_rss,
+        peak_alloc,
+        searches=[search.to_json() for search in searches],
+    )
+
+
+def _megabytes(value: int) -> str:
+    return f"{value / (1024 * 1024):.1f}"
+
+
+PROFILE_HEADERS = [
+    "Year",
+    "Day",
+    "Part",
+    "Wall (s)",
+    "CPU (s)",
+    "Parse (s)",
+    "Compute (s)",
+    "Peak RSS (MB)",
+    "Peak alloc (MB)",
+    "Expanded",
+]
+
+
+def profile_rows(profiles: List[PartProfile]) -> List[List[object]]:
+    return [
+        [
+            p.task.year,
+            p.task.day,
+            p.task.part,
+            f"{p.wall_time:.3f}",
+            f"{p.cpu_time:.3f}",
+            f"{p.parse_time:.3f}",
+            f"{p.compute_time:.3f}",
+            _megabytes(p.peak_rss),
+            _megabytes(p.peak_alloc),
+            p.expanded if p.searches else "",
+        ]
+        for p in profiles
+    ]
+
+
+def write_profiles_json(profiles: List[PartProfile], path: Path) -> None:
+    path.write_text(json.dumps([asdict(p) for p in profiles], indent=2) + "\n")
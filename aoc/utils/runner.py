@@ -0,0 +1,127 @@
+"""Run solutions for many days at once across a pool of worker processes.
+
+Each (year, day, part) is an independent `Task`. Workers look the day up on
+their own, so only the task itself is sent across the process boundary.
+"""
+
+import os
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TypeVar
+
+from aoc.utils.finder import get_day, get_days
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, order=True)
+class Task:
+    year: int
+    day: int
+    part: int
+    example: bool = False
+
+    def __str__(self) -> str:
+        label = f"{self.year} Day {self.day:02d} Part {self.part}"
+        return f"{label} (example)" if self.example else label
+
+
+@dataclass
+class TaskResult:
+    task: Task
+    answer: str | None
+    wall_time: float
+    error: str | None = None
+    cached: bool = False
+
+
+def parse_day_range(spec: str) -> List[int]:
+    """Parse a day selection such as ``1-25`` or ``1,3,5-7``."""
+    result: set[int] = set()
+    for chunk in spec.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if "-" in chunk:
+            start, end = chunk.split("-", 1)
+            result.update(range(int(start), int(end) + 1))
+        else:
+            result.add(int(chunk))
+    return sorted(result)
+
+
+def build_tasks(
+    years: List[int] | None = None, day_numbers: Iterable[int] | None = None
+) -> List[Task]:
+    selected = set(day_numbers) if day_numbers is not None else None
+    return [
+        Task(day.year, day.day_number, part)
+        for day in get_days(years)
+        if selected is None or day.day_number in selected
+        for part in (1, 2)
+    ]
+
+
+def run_task(task: Task) -> TaskResult:
+    start = time.perf_counter()
+    try:
+        day = get_day(task.year, task.day)
+        if day is None:
+            raise Exception(f"No solution for {task.year} day {task.day}")
+        if task.example:
+            text = day.adapt_text(task.part, day.example_input_for_part(task.part - 1))
+            start = time.perf_counter()
+            answer = day.solve_part(task.part, day.parse_input(text))
+        elif not day.input_path.exists():
+            raise Exception(f"Missing input for {task.year} day {task.day}")
+        else:
+            start = time.perf_counter()
+            with day.prepared_input(task.part) as parsed:
+                answer = day.solve_part(task.part, parsed)
+    except Exception as e:
+        return TaskResult(
+            task,
+            None,
+            time.perf_counter() - start,
+            "".join(traceback.format_exception_only(e)).strip(),
+        )
+    return TaskResult(
+        task, None if answer is None else str(answer), time.perf_counter() - start
+    )
+
+
+def run_parsed(task: Task, parsed: Any) -> TaskResult:
+    """Solve one part from input that was already run through ``parse``."""
+    day = get_day(task.year, task.day)
+    if day is None:
+        raise Exception(f"No solution for {task.year} day {task.day}")
+    start = time.perf_counter()
+    answer = day.solve_part(task.part, parsed)
+    return TaskResult(
+        task, None if answer is None else str(answer), time.perf_counter() - start
+    )
+
+
+def run_tasks(
+    tasks: List[Task],
+    jobs: int | None = None,
+    worker: Callable[[Task], R] = run_task,  # type: ignore[assignment]
+    fresh_process: bool = False,
+) -> Iterator[R]:
+    """Yield results in completion order as workers finish them.
+
+    With ``fresh_process`` every task gets a brand new worker, so per-process
+    measurements such as peak RSS only reflect that task.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(tasks) or 1),
+        max_tasks_per_child=1 if fresh_process else None,
+    ) as executor:
+        futures: Dict[Future[R], Task] = {
+            executor.submit(worker, task): task for task in tasks
+        }
+        for future in as_completed(futures):
+            yield future.result()
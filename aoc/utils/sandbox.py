@@ -0,0 +1,95 @@
+"""Run tasks in child processes with a wall-clock timeout and a memory cap.
+
+Each task gets its own process so a runaway part can be killed without
+taking the rest of the batch with it. The memory cap is applied with
+``resource.setrlimit(RLIMIT_AS)``: Linux ignores ``RLIMIT_RSS``, so the limit
+is on address space, which bounds resident memory too. Allocations past the
+cap raise ``MemoryError`` inside the part and are reported like any other
+error.
+"""
+
+import os
+import resource
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import _ConnectionBase, wait
+from typing import Deque, Dict, Iterator, List, Tuple
+
+from aoc.utils.runner import Task, TaskResult, run_task
+
+
+@dataclass(frozen=True)
+class Limits:
+    timeout: float | None = None
+    max_memory: int | None = None
+
+    def __bool__(self) -> bool:
+        return self.timeout is not None or self.max_memory is not None
+
+
+def _run_limited(conn: _ConnectionBase, task: Task, max_memory: int | None) -> None:
+    if max_memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+    conn.send(run_task(task))
+    conn.close()
+
+
+def _exit_reason(process: Process) -> str:
+    if process.exitcode is not None and process.exitcode < 0:
+        return f"WorkerError: killed by signal {-process.exitcode}"
+    return f"WorkerError: exited with code {process.exitcode}"
+
+
+def run_sandboxed(
+    tasks: List[Task], jobs: int | None = None, limits: Limits = Limits()
+) -> Iterator[TaskResult]:
+    """Yield results in completion order, enforcing ``limits`` on every task."""
+    jobs = jobs or os.cpu_count() or 1
+    pending: Deque[Task] = deque(tasks)
+    # Pipe() returns a PipeConnection on Windows, so key on their common base
+    running: Dict[_ConnectionBase, Tuple[Process, Task, float]] = {}
+    while pending or running:
+        while pending and len(running) < jobs:
+            task = pending.popleft()
+            receiver, sender = Pipe(duplex=False)
+            process = Process(
+                target=_run_limited, args=(sender, task, limits.max_memory), daemon=True
+            )
+            process.start()
+            sender.close()
+            running[receiver] = (process, task, time.perf_counter())
+
+        timeout = None
+        if limits.timeout is not None:
+            now = time.perf_counter()
+            timeout = max(
+                0.0,
+                min(start + limits.timeout - now for _, _, start in running.values()),
+            )
+        ready = wait(list(running), timeout)
+
+        now = time.perf_counter()
+        for receiver in list(running):
+            process, task, start = running[receiver]
+            if receiver in ready:
+                try:
+                    result = receiver.recv()
+                except EOFError:
+                    process.join()
+                    result = TaskResult(task, None, now - start, _exit_reason(process))
+            elif limits.timeout is not None and now - start >= limits.timeout:
+                process.kill()
+                result = TaskResult(
+                    task,
+                    None,
+                    now - start,
+                    f"TimeoutError: exceeded {limits.timeout:g}s",
+                )
+            else:
+                continue
+            del running[receiver]
+            receiver.close()
+            process.join()
+            yield result
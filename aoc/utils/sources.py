@@ -0,0 +1,57 @@
+"""Find the ``aoc`` source files a solution depends on without importing it."""
+
+import re
+from pathlib import Path
+from typing import List, Set
+
+from aoc.utils.finder import PROJECT_PATH
+
+IMPORT_PATTERN = re.compile(r"^\s*(?:from|import)\s+(aoc(?:\.\w+)+)", re.MULTILINE)
+
+
+def module_file(module_name: str) -> Path | None:
+    relative = Path(*module_name.split("."))
+    for candidate in [
+        PROJECT_PATH.parent / relative.with_suffix(".py"),
+        PROJECT_PATH.parent / relative / "__init__.py",
+    ]:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def module_name(path: Path) -> str:
+    parts = list(path.relative_to(PROJECT_PATH.parent).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def imported_files(path: Path) -> List[Path]:
+    """The ``aoc`` modules ``path`` imports directly."""
+    result = []
+    for name in IMPORT_PATTERN.findall(path.read_text()):
+        imported = module_file(name)
+        if imported is not None:
+            result.append(imported)
+    return result
+
+
+def source_files(path: Path) -> List[Path]:
+    """``path`` plus every ``aoc`` module it transitively imports.
+
+    Files are ordered so each comes after everything it imports.
+    """
+    seen: Set[Path] = set()
+    result: List[Path] = []
+
+    def visit(current: Path) -> None:
+        if current in seen:
+            return
+        seen.add(current)
+        for imported in imported_files(current):
+            visit(imported)
+        result.append(current)
+
+    visit(path)
+    return result
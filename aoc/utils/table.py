@@ -0,0 +1,14 @@
+from typing import Iterable, List, Sequence
+
+
+def format_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> str:
+    """Render rows as a plain-text table with left-aligned columns."""
+    cells: List[List[str]] = [[str(x) for x in headers]]
+    cells.extend([str(x) for x in row] for row in rows)
+    widths = [max(len(row[col]) for row in cells) for col in range(len(headers))]
+    lines = [
+        "  ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip()
+        for row in cells
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
@@ -0,0 +1,87 @@
+"""Re-run a day whenever its solution, example or input changes.
+
+The interpreter stays warm between runs; only modules whose source changed
+are reloaded. Changes are detected by polling modification times, which works
+everywhere without extra dependencies.
+"""
+
+import importlib
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List
+
+from aoc.utils.finder import Day
+from aoc.utils.sources import imported_files, module_name, source_files
+
+
+def _watched_files(day: Day) -> List[Path]:
+    return source_files(day.module_path) + [day.example_path, day.input_path]
+
+
+def _mtimes(paths: List[Path]) -> Dict[Path, int]:
+    return {path: path.stat().st_mtime_ns for path in paths if path.exists()}
+
+
+def _reload(changed: List[Path], day: Day) -> None:
+    """Reload changed modules and every watched module that imports them."""
+    stale = {path for path in changed if path.suffix == ".py"}
+    if not stale:
+        return
+    # Dependencies come first, so a module is reloaded after what it imports
+    for path in source_files(day.module_path):
+        if path not in stale and not stale.intersection(imported_files(path)):
+            continue
+        stale.add(path)
+        module = sys.modules.get(module_name(path))
+        if module is not None:
+            importlib.reload(module)
+
+
+def run_once(year: int, day_number: int) -> None:
+    day = Day(year, day_number)
+    print(f"🎄 Advent of Code {year}: Day {day_number} 🎄")
+    try:
+        for part, expected in enumerate(day.example_answers, 1):
+            start = time.perf_counter()
+            text = day.adapt_text(part, day.example_input_for_part(part - 1))
+            answer = str(day.solve_part(part, day.parse_input(text)))
+            elapsed = time.perf_counter() - start
+            status = "✅" if answer == expected else f"❌ expected {expected}"
+            print(f"Example part {part}: {answer} {status} ({elapsed:.3f}s)")
+        if not day.input_path.exists():
+            return
+        for part in (1, 2):
+            start = time.perf_counter()
+            with day.prepared_input(part) as parsed:
+                answer = day.solve_part(part, parsed)
+            elapsed = time.perf_counter() - start
+            print(f"Part {part}:\n{answer}\n({elapsed:.3f}s)")
+    except Exception:
+        traceback.print_exc()
+
+
+def watch(year: int, day_number: int, interval: float = 0.5) -> None:
+    day = Day(year, day_number)
+    mtimes = _mtimes(_watched_files(day))
+    run_once(year, day_number)
+    print("\n👀 Watching for changes (Ctrl-C to stop)")
+    while True:
+        time.sleep(interval)
+        current = _mtimes(_watched_files(day))
+        changed = [
+            path
+            for path in current.keys() | mtimes.keys()
+            if current.get(path) != mtimes.get(path)
+        ]
+        if not changed:
+            continue
+        mtimes = current
+        print(f"\n🔁 {', '.join(sorted(p.name for p in changed))} changed\n")
+        try:
+            _reload(changed, day)
+        except Exception:
+            traceback.print_exc()
+            continue
+        run_once(year, day_number)